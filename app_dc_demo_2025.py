@@ -376,7 +376,8 @@ def get_push_data():
         }), 400
     
     try:
-        push_data = ctrl.get_push_data()
+        # get_push_data() returns a read-only view; jsonify needs a dict
+        push_data = dict(ctrl.get_push_data())
         
         return jsonify({
             'success': True,
@@ -636,6 +637,7 @@ def auto_charge_config():
             data = request.json
             
             # Update controller settings
+            # (the setter starts or stops the battery worker, so toggling the flag is enough)
             if 'enable_auto_charge' in data:
                 ctrl.enable_auto_charge = data['enable_auto_charge']
             
@@ -651,12 +653,6 @@ def auto_charge_config():
             if 'charge_battery_percentage' in data:
                 ctrl.charge_battery_percentage = data['charge_battery_percentage']
             
-            # Start or stop battery monitor thread based on enable_auto_charge
-            if ctrl.enable_auto_charge:
-                ctrl._start_battery_monitor(verbose=True)
-            else:
-                ctrl._stop_battery_monitor(verbose=True)
-            
             logger.info(f"Auto-charge config updated: enable={ctrl.enable_auto_charge}, "
                        f"pre_charge={ctrl.pre_charge_point}, charge={ctrl.charge_point}, "
                        f"warning={ctrl.warning_battery_percentage}%, "
@@ -12,6 +12,7 @@ Date: October 22, 2025
 
 from smart_seer_controller import SmartSeerController
 from typing import Dict, Any, List
+import logging
 
 
 class DCDemo2025Controller(SmartSeerController):
@@ -641,6 +642,8 @@ def main():
     Provides a command-line interface for controlling the SEER robot
     with DC Demo 2025 specific navigation functions.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("="*60)
     print("🤖 DC Demo 2025 Controller - Interactive Control")
     print("="*60)
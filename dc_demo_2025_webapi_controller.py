@@ -20,6 +20,17 @@ import requests
 from typing import Dict, Any, List, Optional
 
 
+# Task status text indexed by status code (0 = NONE ... 6 = CANCELED)
+_STATUS_TEXT = ("NONE", "WAITING", "RUNNING", "SUSPENDED", "COMPLETED", "FAILED", "CANCELED")
+
+
+def _status_text(status: Optional[int]) -> str:
+    """Return the text for a task status code, or 'UNKNOWN' (e.g. for None)."""
+    if isinstance(status, int) and 0 <= status < len(_STATUS_TEXT):
+        return _STATUS_TEXT[status]
+    return "UNKNOWN"
+
+
 class DCDemo2025WebAPIController:
     """
     DC Demo 2025 Web API Controller - Control robot through web interface.
@@ -566,11 +577,7 @@ def main():
                 # Special handling for methods that return specific types
                 elif func_name == 'task_status':
                     status = controller.task_status()
-                    status_map = {
-                        0: "NONE", 1: "WAITING", 2: "RUNNING", 3: "SUSPENDED",
-                        4: "COMPLETED", 5: "FAILED", 6: "CANCELED"
-                    }
-                    print(f"📊 Task status: {status} ({status_map.get(status, 'UNKNOWN')})")
+                    print(f"📊 Task status: {status} ({_status_text(status)})")
                 
                 elif func_name == 'is_connected':
                     connected = controller.is_connected()
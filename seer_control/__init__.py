@@ -38,7 +38,7 @@ from .seer_control_controller import SeerControlController
 from .seer_config_controller import SeerConfigController
 from .seer_other_controller import SeerOtherController
 from .seer_push_controller import SeerPushController
-from .util import parse_command_line
+from .util import parse_command_line, parse_command_log
 
 __version__ = "1.0.0"
 __all__ = [
@@ -50,4 +50,5 @@ __all__ = [
     "SeerOtherController",
     "SeerPushController",
     "parse_command_line",
+    "parse_command_log",
 ]
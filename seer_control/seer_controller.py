@@ -32,6 +32,7 @@ Author: Assistant
 Date: October 21, 2025
 """
 
+import time
 from typing import Dict, Any
 try:
     from .seer_status_controller import SeerStatusController
@@ -49,6 +50,20 @@ except ImportError:
     from seer_push_controller import SeerPushController
 
 
+# Task status code -> text
+# 0 = NONE, 1 = WAITING, 2 = RUNNING, 3 = SUSPENDED
+# 4 = COMPLETED, 5 = FAILED, 6 = CANCELED
+TASK_STATUS_TEXT = {
+    0: "NONE",
+    1: "WAITING",
+    2: "RUNNING",
+    3: "SUSPENDED",
+    4: "COMPLETED",
+    5: "FAILED",
+    6: "CANCELED"
+}
+
+
 class SeerController:
     """
     Unified SEER Robot Controller - Connection Manager.
@@ -110,18 +125,12 @@ class SeerController:
         Connect to all robot services.
         
         Args:
-            timeout: Connection timeout in seconds
+            timeout: Overall connection timeout in seconds, shared by all services
             
         Returns:
             Dictionary showing connection status for each service
         """
-        self._connections['status'] = self.status.connect(timeout)
-        self._connections['task'] = self.task.connect(timeout)
-        self._connections['control'] = self.control.connect(timeout)
-        self._connections['config'] = self.config.connect(timeout)
-        self._connections['other'] = self.other.connect(timeout)
-        self._connections['push'] = self.push.connect(timeout)
-        
+        self._connect_services(('status', 'task', 'control', 'config', 'other', 'push'), timeout)
         return self._connections.copy()
     
     def connect_essential(self, timeout: float = 5.0) -> Dict[str, bool]:
@@ -129,21 +138,36 @@ class SeerController:
         Connect to essential services only (status, task, control).
         
         Args:
-            timeout: Connection timeout in seconds
+            timeout: Overall connection timeout in seconds, shared by the three services
             
         Returns:
             Dictionary showing connection status for essential services
         """
-        self._connections['status'] = self.status.connect(timeout)
-        self._connections['task'] = self.task.connect(timeout)
-        self._connections['control'] = self.control.connect(timeout)
-        
+        self._connect_services(('status', 'task', 'control'), timeout)
         return {
             'status': self._connections['status'],
             'task': self._connections['task'],
             'control': self._connections['control']
         }
     
+    def _connect_services(self, names, timeout: float) -> None:
+        """
+        Connect services one after another within a single deadline.
+        
+        Each service gets only the time left before the deadline; once it has
+        passed, the remaining services are not attempted. Later lazy
+        reconnects of a service still use the full timeout.
+        """
+        deadline = time.monotonic() + timeout
+        for name in names:
+            service = getattr(self, name)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._connections[name] = service.connected
+                continue
+            self._connections[name] = service.connect(remaining)
+            service._connect_timeout = timeout
+    
     def disconnect_all(self):
         """Disconnect from all robot services."""
         self.status.disconnect()
@@ -164,7 +188,8 @@ class SeerController:
     # Task Monitoring
     # ========================================================================
     
-    def wait_task_complete(self, query_interval: float = 1.0, timeout: float = 600.0) -> Dict[str, Any]:
+    def wait_task_complete(self, query_interval: float = 1.0, timeout: float = 600.0,
+                           query_interval_min: float = 0.05) -> Dict[str, Any]:
         """
         Wait for current task to complete by monitoring task status.
         
@@ -172,9 +197,15 @@ class SeerController:
         Returns when task reaches a terminal state: COMPLETED (4), FAILED (5), 
         CANCELED (6), SUSPENDED (3), or NONE (0).
         
+        The first queries are issued query_interval_min apart and the interval
+        doubles while the status is unchanged, up to query_interval. Tasks that
+        finish quickly are detected within tens of milliseconds, while long
+        tasks are still polled about once per query_interval.
+        
         Args:
-            query_interval: Time between status queries in seconds (default: 1.0)
+            query_interval: Maximum time between status queries in seconds (default: 1.0)
             timeout: Maximum time to wait in seconds (default: 600.0 = 10 min)
+            query_interval_min: Initial time between status queries in seconds (default: 0.05)
         
         Returns:
             Dictionary containing:
@@ -197,8 +228,6 @@ class SeerController:
             else:
                 print(f"Task failed: {result['status_text']}")
         """
-        import time
-        
         if not self._connections.get('status', False):
             return {
                 'success': False,
@@ -212,10 +241,13 @@ class SeerController:
             }
         
         query_count = 0
-        start_time = time.time()
+        interval = min(query_interval_min, query_interval)
+        last_status = None
+        # Monotonic clock: elapsed time is unaffected by system clock changes
+        start_time = time.monotonic()
         
         while True:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             
             # Check timeout
             if elapsed > timeout:
@@ -237,25 +269,19 @@ class SeerController:
             
             if not task_result or task_result.get('ret_code') != 0:
                 # Failed to query, wait and retry
-                time.sleep(query_interval)
+                time.sleep(interval)
+                interval = min(interval * 2, query_interval)
                 continue
             
             # Extract task status
             task_status = task_result.get('task_status', -1)
             
-            # Status meanings:
-            # 0 = NONE, 1 = WAITING, 2 = RUNNING, 3 = SUSPENDED
-            # 4 = COMPLETED, 5 = FAILED, 6 = CANCELED
-            status_text_map = {
-                0: "NONE",
-                1: "WAITING",
-                2: "RUNNING",
-                3: "SUSPENDED",
-                4: "COMPLETED",
-                5: "FAILED",
-                6: "CANCELED"
-            }
-            status_text = status_text_map.get(task_status, "UNKNOWN")
+            # Poll fast again after a status change
+            if task_status != last_status:
+                last_status = task_status
+                interval = min(query_interval_min, query_interval)
+            
+            status_text = TASK_STATUS_TEXT.get(task_status, "UNKNOWN")
             
             # If not running (status != 2), task is done
             if task_status != 2:
@@ -273,7 +299,8 @@ class SeerController:
                 }
             
             # Task still running, wait before next query
-            time.sleep(query_interval)
+            time.sleep(interval)
+            interval = min(interval * 2, query_interval)
     
     # ========================================================================
     # Statistics and Information
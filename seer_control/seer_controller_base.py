@@ -10,7 +10,10 @@ Features:
 - Protocol handling (header packing/unpacking)
 - Generic command sending with request-response pattern
 - Error handling and timeout management
-- Thread-safe operations
+- Thread-safe operations (one lock per connection)
+- Persistent keepalive connections with lazy reconnect
+- Low-latency sockets (TCP_NODELAY, TCP_QUICKACK on Linux)
+- Shared JSON codec (orjson when installed)
 
 Manual: https://seer-group.feishu.cn/wiki/WsI2wM46YiESh8k12EBclv23nOf?table=tblObW6PmjUPTyTn&view=vewiqqgyEX
 
@@ -21,14 +24,34 @@ Date: October 18, 2025
 import socket
 import json
 import struct
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 # Protocol constants
 MAGIC_BYTE = 0x5A
 HEADER_FORMAT = '!BBHLH6s'
 HEADER_SIZE = 16
 PACK_FMT_STR = '!BBHLH6s'
+RESERVED_BYTES = b'\x00' * 6
+
+# Payload codec for every request/response frame. orjson is used when installed;
+# otherwise one shared stdlib encoder/decoder pair (compact, ASCII-escaped).
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_encode = json.JSONEncoder(separators=(',', ':')).encode
+    _json_decode = json.JSONDecoder().decode
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a payload to UTF-8 JSON bytes."""
+        return _json_encode(obj).encode('ascii')
+
+    def _json_loads(data: bytes) -> Any:
+        """Parse UTF-8 JSON bytes."""
+        return _json_decode(data.decode('utf-8'))
 
 
 def packMasg(reqId, msgType, msg={}):
@@ -46,16 +69,16 @@ def packMasg(reqId, msgType, msg={}):
         bytes: Packed message ready to send
     """
     msgLen = 0
-    jsonStr = json.dumps(msg)
     if (msg != {}):
-        msgLen = len(jsonStr)
+        jsonBytes = _json_dumps(msg)
+        msgLen = len(jsonBytes)
     rawMsg = struct.pack(PACK_FMT_STR, 0x5A, 0x01, reqId, msgLen, msgType, b'\x00\x00\x00\x00\x00\x00')
     # Debug print - commented out to reduce console output
     # print("{:02X} {:02X} {:04X} {:08X} {:04X}"
     # .format(0x5A, 0x01, reqId, msgLen, msgType))
 
     if (msg != {}):
-        rawMsg += bytearray(jsonStr,'ascii')
+        rawMsg += jsonBytes
         # Debug print - commented out to reduce console output
         # print(msg)
 
@@ -76,6 +99,10 @@ class SeerControllerBase:
     that add domain-specific query methods.
     """
     
+    # Message types the robot may send on this port without a request (e.g.
+    # push data); _recv_response() discards them while waiting for a reply
+    UNSOLICITED_TYPES = frozenset()
+    
     def __init__(self, robot_ip: str = '192.168.192.5', robot_port: int = 19204):
         """
         Initialize the base controller.
@@ -88,6 +115,22 @@ class SeerControllerBase:
         self.robot_port = robot_port
         self.socket = None
         self.connected = False
+        self._connect_timeout = 5.0
+        
+        # Serializes request/response exchanges on the shared socket
+        self._lock = threading.RLock()
+        
+        # Reusable frame buffer for send_command() (guarded by _lock, grows on demand)
+        self._req_buf = bytearray(4096)
+        
+        # Socket options applied by connect() (and so by every lazy reconnect)
+        self.tcp_nodelay = True  # Send small request frames without Nagle delay
+        self.sndbuf: Optional[int] = None  # SO_SNDBUF in bytes, None for the kernel default
+        self.rcvbuf: Optional[int] = None  # SO_RCVBUF in bytes, None for the kernel default
+        
+        # Re-arm TCP_QUICKACK before each read so replies are ACKed without
+        # the delayed-ACK timer (Linux only, switched off where unsupported)
+        self.quick_ack = True
         
         # Connection statistics
         self.stats = {
@@ -151,6 +194,32 @@ class SeerControllerBase:
             msg = {}
         return packMasg(req_id, msg_type, msg)
     
+    def _pack_request(self, req_id: int, msg_type: int, msg: Optional[Dict]) -> memoryview:
+        """
+        Pack a message into the reusable request buffer.
+        
+        Produces the same frame as pack_message() without allocating a new
+        bytes object per request. Must be called with self._lock held, and the
+        returned view is only valid until the next call.
+        
+        Args:
+            req_id: Request ID
+            msg_type: Message type identifier
+            msg: Optional message payload as dictionary
+            
+        Returns:
+            View of the packed frame in the request buffer
+        """
+        body = _json_dumps(msg) if msg else b''
+        size = HEADER_SIZE + len(body)
+        buf = self._req_buf
+        if size > len(buf):
+            buf = self._req_buf = bytearray(size)
+        struct.pack_into(PACK_FMT_STR, buf, 0, MAGIC_BYTE, 0x01, req_id, len(body),
+                         msg_type, RESERVED_BYTES)
+        buf[HEADER_SIZE:size] = body
+        return memoryview(buf)[:size]
+    
     def connect(self, timeout: float = 5.0) -> bool:
         """
         Establish connection to the robot.
@@ -166,8 +235,17 @@ class SeerControllerBase:
             if self.connected:
                 return True
             
-            # Create new socket
+            # Create new socket (kept open for the controller's lifetime)
+            self._connect_timeout = timeout
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if self.tcp_nodelay:
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffer sizes must be set before connecting to affect window scaling
+            if self.sndbuf:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            if self.rcvbuf:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
             self.socket.settimeout(timeout)
             
             # Attempt connection
@@ -261,78 +339,256 @@ class SeerControllerBase:
         Notes:
             - Automatically updates connection statistics
             - Returns None on any error (timeout, connection loss, parsing error)
-            - Validates magic byte in response header
+            - Validates magic byte and response type in the response header
+            - After a timeout or a mismatched reply the socket is closed, so a
+              late reply cannot be read as the answer to the next command; the
+              next command reconnects
         """
         if not self.connected:
             return None
         
+        # Errors are handled under the lock so no other exchange can read
+        # a late reply on a socket that is about to be dropped
+        with self._lock:
+            try:
+                self.stats['total_commands_sent'] += 1
+                
+                # Create and send request
+                self._send_request(self._pack_request(req_id, msg_type, msg))
+                
+                # Receive and parse response
+                json_data = self._recv_response(timeout, expected_response)
+                
+            except socket.timeout:
+                self._drop_socket()
+                self.stats['failed_commands'] += 1
+                return None
+            except (ConnectionResetError, BrokenPipeError, OSError):
+                self.connected = False
+                self.stats['failed_commands'] += 1
+                return None
+            except Exception:
+                self._drop_socket()
+                self.stats['failed_commands'] += 1
+                return None
+        
+        if json_data is None:
+            self.stats['failed_commands'] += 1
+            return None
+        
+        # Success
+        self.stats['successful_commands'] += 1
+        return json_data
+    
+    def _send_request(self, data: Union[bytes, memoryview]) -> None:
+        """
+        Send request bytes on the persistent socket.
+        
+        If the robot has closed the idle connection, the socket is reopened
+        once and the request is resent. A socket closed by _drop_socket() is
+        reopened first. Must be called with self._lock held.
+        
+        Raises:
+            OSError: If reconnecting fails or sending fails again after reconnecting
+        """
+        if self.socket is None:
+            self.disconnect()
+            if not self.connect(self._connect_timeout):
+                raise ConnectionError("Reconnect failed")
         try:
-            self.stats['total_commands_sent'] += 1
+            self.socket.sendall(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # Peer dropped the connection; reconnect lazily and resend
+            self.disconnect()
+            if not self.connect(self._connect_timeout):
+                raise
+            self.socket.sendall(data)
+    
+    def _drop_socket(self) -> None:
+        """
+        Close the socket after an exchange went out of sync with the robot.
+        
+        Replies still in flight (after a timeout or a mismatched reply) would
+        otherwise be read as answers to later commands. The controller stays
+        marked as connected and the next request reconnects. Must be called
+        with self._lock held or after the exchange has finished.
+        """
+        sock, self.socket = self.socket, None
+        if sock is not None:
+            try:
+                sock.close()
+            except Exception:
+                pass
+            self.stats['last_disconnect_time'] = time.time()
+    
+    def _rearm_quickack(self) -> None:
+        """
+        Set TCP_QUICKACK on the socket.
+        
+        The kernel clears the flag again after it sends an ACK, so this is
+        called before every read. Disables quick_ack if the platform does not
+        support the option.
+        """
+        try:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (AttributeError, OSError):
+            self.quick_ack = False
+    
+    def _recv_response(self, timeout: float, expected_response: int = None) -> Optional[Dict]:
+        """
+        Receive and parse one response message from the socket.
+        
+        Frames of a type in UNSOLICITED_TYPES that arrive before the expected
+        reply are read and discarded; timeout bounds the whole wait.
+        
+        Args:
+            timeout: Socket timeout in seconds
+            expected_response: Optional expected response message type for validation
             
-            # Create and send request
-            request_msg = self.pack_message(req_id, msg_type, msg)
-            self.socket.send(request_msg)
+        Returns:
+            Response data as dictionary, or None if the connection was closed
+            or the payload is unparsable
+            
+        Raises:
+            socket.timeout, OSError: Propagated to the caller
+            ValueError: If the header is short, has a bad magic byte or is not
+                        the expected response type (the stream is out of sync)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
             
             # Receive response header
-            self.socket.settimeout(timeout)
+            self.socket.settimeout(remaining)
+            if self.quick_ack:
+                self._rearm_quickack()
             header_data = self.socket.recv(HEADER_SIZE)
             
             if not header_data:
-                self.stats['failed_commands'] += 1
                 return None
             
+            # The header may arrive in pieces
+            while len(header_data) < HEADER_SIZE:
+                chunk = self.socket.recv(HEADER_SIZE - len(header_data))
+                if not chunk:
+                    break
+                header_data += chunk
+            
             # Parse header
             header = self.unpack_header(header_data)
             
             # Validate magic byte
             if header['magic'] != MAGIC_BYTE:
-                self.stats['failed_commands'] += 1
+                raise ValueError(f"Bad magic byte: 0x{header['magic']:02X}")
+            
+            # Validate response type if specified (a mismatch is a reply to another request)
+            msg_type = header['msg_type']
+            if expected_response is not None and msg_type != expected_response:
+                if msg_type in self.UNSOLICITED_TYPES:
+                    self._recv_payload(header['msg_len'])
+                    continue
+                raise ValueError(f"Unexpected response type {msg_type}, "
+                                 f"expected {expected_response}")
+            break
+        
+        # Receive JSON data if present
+        json_data = {}
+        if header['msg_len'] > 0:
+            json_bytes = self._recv_payload(header['msg_len'])
+            
+            # Parse JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            try:
+                json_data = _json_loads(json_bytes)
+            except (UnicodeDecodeError, json.JSONDecodeError):
                 return None
+        
+        return json_data
+    
+    def _recv_payload(self, length: int) -> bytes:
+        """
+        Receive a frame payload of the given length.
+        
+        Returns:
+            The payload bytes (shorter than length if the connection closed)
+        """
+        if length <= 0:
+            return b''
+        if self.quick_ack:
+            self._rearm_quickack()
+        json_bytes = b''
+        remaining = length
+        
+        # Receive in chunks
+        while remaining > 0:
+            chunk_size = min(1024, remaining)
+            chunk = self.socket.recv(chunk_size)
             
-            # Validate response type if specified
-            if expected_response is not None and header['msg_type'] != expected_response:
-                # Response type mismatch - still process but could log warning
-                pass
+            if not chunk:
+                break
             
-            # Receive JSON data if present
-            json_data = {}
-            if header['msg_len'] > 0:
-                json_bytes = b''
-                remaining = header['msg_len']
-                
-                # Receive in chunks
-                while remaining > 0:
-                    chunk_size = min(1024, remaining)
-                    chunk = self.socket.recv(chunk_size)
-                    
-                    if not chunk:
-                        break
-                    
-                    json_bytes += chunk
-                    remaining -= len(chunk)
-                
-                # Parse JSON
-                try:
-                    json_str = json_bytes.decode('utf-8')
-                    json_data = json.loads(json_str)
-                except (UnicodeDecodeError, json.JSONDecodeError):
-                    self.stats['failed_commands'] += 1
-                    return None
+            json_bytes += chunk
+            remaining -= len(chunk)
+        return json_bytes
+    
+    def send_commands(self, requests: List[Tuple[int, Optional[Dict], Optional[int]]],
+                      timeout: float = 5.0) -> List[Optional[Dict]]:
+        """
+        Send several commands back-to-back and receive their responses in order.
+        
+        All request frames are written with a single send before any response
+        is read, so N commands cost one network round-trip instead of N.
+        The robot answers requests on a connection in the order received.
+        
+        Args:
+            requests: List of (msg_type, msg, expected_response) tuples
+            timeout: Socket timeout in seconds for each response (default: 5.0)
             
-            # Success
-            self.stats['successful_commands'] += 1
-            return json_data
+        Returns:
+            List of response dictionaries in request order; an entry is None
+            if that command failed (after a timeout, a mismatched reply or a
+            connection error all remaining entries are None, and the socket is
+            closed so unread replies cannot reach later commands)
             
-        except socket.timeout:
-            self.stats['failed_commands'] += 1
-            return None
-        except (ConnectionResetError, BrokenPipeError, OSError):
-            self.connected = False
-            self.stats['failed_commands'] += 1
-            return None
-        except Exception:
-            self.stats['failed_commands'] += 1
-            return None
+        Example:
+            # Query position and battery in one round-trip
+            loc, battery = ctrl.send_commands([
+                (1004, None, 11004),
+                (1007, None, 11007),
+            ])
+        """
+        results = [None] * len(requests)
+        if not self.connected or not requests:
+            return results
+        
+        self.stats['total_commands_sent'] += len(requests)
+        
+        # Errors are handled under the lock so no other exchange can read
+        # the replies left unread on a socket that is about to be dropped
+        with self._lock:
+            try:
+                # Write all request frames at once (request IDs 1..N)
+                self._send_request(b''.join(
+                    self.pack_message(req_id, msg_type, msg)
+                    for req_id, (msg_type, msg, _) in enumerate(requests, 1)
+                ))
+                
+                # Drain responses in order
+                for i, (_, _, expected_response) in enumerate(requests):
+                    results[i] = self._recv_response(timeout, expected_response)
+                
+            except socket.timeout:
+                self._drop_socket()
+            except (ConnectionResetError, BrokenPipeError, OSError):
+                self.connected = False
+            except Exception:
+                self._drop_socket()
+        
+        succeeded = sum(1 for r in results if r is not None)
+        self.stats['successful_commands'] += succeeded
+        self.stats['failed_commands'] += len(requests) - succeeded
+        return results
     
     def get_stats(self) -> Dict[str, Any]:
         """
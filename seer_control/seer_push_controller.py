@@ -21,7 +21,9 @@ Author: Assistant
 Date: October 18, 2025
 """
 
+import selectors
 import socket
+import sys
 import time
 import json
 import threading
@@ -59,6 +61,9 @@ class SeerPushController(SeerControllerBase):
         controller.stop_listening()
     """
     
+    # Push data frames (robot_push) may arrive before the config reply
+    UNSOLICITED_TYPES = frozenset({19301})
+    
     def __init__(self, robot_ip: str = '192.168.192.5', 
                  robot_port: int = 19301):
         """
@@ -73,9 +78,11 @@ class SeerPushController(SeerControllerBase):
         
         self.listening = False
         self.listener_thread = None
+        self._wakeup: Optional[tuple] = None  # (reader, writer) socketpair that interrupts the listen loop
         self.callback = None
+        self._pretty_print = True  # Set per listen loop from sys.stdout.isatty()
         
-        # Push-specific statistics
+        # Push-specific statistics (times are time.monotonic() readings)
         self.push_stats = {
             'packets_received': 0,
             'bytes_received': 0,
@@ -168,13 +175,17 @@ class SeerPushController(SeerControllerBase):
             return False
         
         # Must be connected to push port
-        if not self.connected:
+        if not self.connected or self.socket is None:
             print("❌ Not connected to robot. Call connect() first.")
             return False
         
         # Set callback
         self.callback = callback
         
+        # Fresh wakeup channel for stop_listening() (replaces one left by a dropped connection)
+        self._close_wakeup()
+        self._wakeup = socket.socketpair()
+        
         # Start listener thread
         self.listening = True
         self.listener_thread = threading.Thread(target=self._listen_loop, daemon=True)
@@ -192,26 +203,70 @@ class SeerPushController(SeerControllerBase):
         print("🛑 Stopping push data listener...")
         self.listening = False
         
+        # Wake the listen loop so it sees the flag immediately
+        wakeup = self._wakeup
+        if wakeup is not None:
+            try:
+                wakeup[1].send(b'\0')
+            except OSError:
+                pass
+        
         # Wait for thread to finish
         if self.listener_thread and self.listener_thread.is_alive():
             self.listener_thread.join(timeout=2.0)
+        self._close_wakeup()
         
         # Print final stats
         self._print_final_stats()
         
         print("✅ Push data listener stopped")
     
+    def _close_wakeup(self):
+        """Close the stop_listening() wakeup socketpair, if any."""
+        wakeup, self._wakeup = self._wakeup, None
+        if wakeup is not None:
+            for sock in wakeup:
+                sock.close()
+    
+    def _drop_socket(self) -> None:
+        """
+        Close the push socket after a failed exchange and mark the controller disconnected.
+        
+        Unlike the request/reply services there is no lazy reconnect here: the
+        listener reads this socket, so losing it is a disconnection.
+        """
+        super()._drop_socket()
+        self.connected = False
+    
     def _listen_loop(self):
-        """Main listening loop (runs in background thread)."""
+        """
+        Main listening loop (runs in background thread).
+        
+        Sleeps in a selector on the push socket and the wakeup socketpair, so
+        it only runs when data arrives or stop_listening() is called instead
+        of polling with a short recv timeout.
+        """
         buffer = b""
-        self.push_stats['start_time'] = time.time()
+        self.push_stats['start_time'] = time.monotonic()
+        # Pretty-print packets for a terminal, one line each when piped to a log
+        self._pretty_print = sys.stdout.isatty()
+        sel = selectors.DefaultSelector()
         
         try:
-            # Set short timeout for responsive interruption
+            # recv() only runs once the selector reports data; keep a short
+            # timeout anyway so a spurious wakeup cannot block the thread
             self.socket.settimeout(0.1)
+            sel.register(self.socket, selectors.EVENT_READ)
+            if self._wakeup is not None:
+                sel.register(self._wakeup[0], selectors.EVENT_READ)
             
-            while self.listening and self.connected:
+            while self.listening and self.connected and self.socket is not None:
                 try:
+                    # Wait for push data or a stop request (the timeout only
+                    # guards against the socket being closed under us)
+                    if not sel.select(timeout=1.0) or not self.listening:
+                        continue
+                    
                     # Receive data from robot
                     data = self.socket.recv(4096)
                     
@@ -249,6 +304,7 @@ class SeerPushController(SeerControllerBase):
             print(f"Error in listen loop: {e}")
             self.push_stats['errors'] += 1
         finally:
+            sel.close()
             self.listening = False
     
     def _process_packet(self, json_packet: bytes):
@@ -267,11 +323,13 @@ class SeerPushController(SeerControllerBase):
                 except Exception as e:
                     print(f"⚠️ Callback error: {e}")
             else:
-                # Default: print formatted data
-                timestamp = time.strftime('%H:%M:%S.%f')[:-3]
-                print(f"\n[{timestamp}] Push Message #{self.push_stats['packets_received']} (Freq: {self._get_current_frequency():.1f}Hz)")
-                print(json.dumps(parsed_data, indent=2, ensure_ascii=False))
-                print("-" * 60)
+                # Default: print formatted data (one write per packet)
+                timestamp = time.strftime('%H:%M:%S')
+                indent = 2 if self._pretty_print else None
+                print(f"\n[{timestamp}] Push Message #{self.push_stats['packets_received']} "
+                      f"(Freq: {self._get_current_frequency():.1f}Hz)\n"
+                      f"{json.dumps(parsed_data, indent=indent, ensure_ascii=False)}\n"
+                      f"{'-' * 60}")
                 
         except json.JSONDecodeError as e:
             print(f"⚠️ Invalid JSON: {e}")
@@ -445,7 +503,7 @@ class SeerPushController(SeerControllerBase):
     
     def _update_stats(self):
         """Update packet statistics."""
-        current_time = time.time()
+        current_time = time.monotonic()
         self.push_stats['packets_received'] += 1
         
         if self.push_stats['last_packet_time'] is not None:
@@ -467,8 +525,8 @@ class SeerPushController(SeerControllerBase):
     
     def _print_final_stats(self):
         """Print final statistics."""
-        if self.push_stats['start_time']:
-            total_time = time.time() - self.push_stats['start_time']
+        if self.push_stats['start_time'] is not None:
+            total_time = time.monotonic() - self.push_stats['start_time']
             avg_frequency = self.push_stats['packets_received'] / total_time if total_time > 0 else 0
             
             print(f"\n📊 Push Data Statistics:")
@@ -490,8 +548,8 @@ class SeerPushController(SeerControllerBase):
             Dictionary containing current statistics
         """
         stats = dict(self.push_stats)
-        if self.push_stats['start_time']:
-            stats['total_time'] = time.time() - self.push_stats['start_time']
+        if self.push_stats['start_time'] is not None:
+            stats['total_time'] = time.monotonic() - self.push_stats['start_time']
             stats['avg_frequency'] = (
                 self.push_stats['packets_received'] / stats['total_time'] 
                 if stats['total_time'] > 0 else 0
@@ -504,7 +562,7 @@ class SeerPushController(SeerControllerBase):
         self.push_stats = {
             'packets_received': 0,
             'bytes_received': 0,
-            'start_time': time.time() if self.listening else None,
+            'start_time': time.monotonic() if self.listening else None,
             'last_packet_time': None,
             'frequencies': [],
             'errors': 0
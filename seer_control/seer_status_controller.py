@@ -27,7 +27,7 @@ Author: Assistant
 Date: October 18, 2025
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 try:
     from .seer_controller_base import SeerControllerBase
 except ImportError:
@@ -264,6 +264,52 @@ class SeerStatusController(SeerControllerBase):
         
         return result
     
+    def query_status_batch(self, query_types: Sequence[str], timeout: float = 5.0) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Query several status types in one network round-trip.
+        
+        All query frames are written back-to-back before any response is read
+        (see send_commands()), so N queries cost one round-trip instead of N.
+        Query statistics are updated per type as in query_status().
+        
+        Args:
+            query_types: Types of status to query (e.g., ['battery', 'task'])
+            timeout: Timeout per response in seconds (default: 5.0)
+            
+        Returns:
+            Dictionary mapping each query type to its response data,
+            or None for queries that failed
+            
+        Raises:
+            ValueError: If a query type is not supported
+            
+        Example:
+            status = controller.query_status_batch(['battery', 'loc'])
+            if status['battery']:
+                print(f"Battery: {status['battery']['battery_level']}")
+        """
+        requests = []
+        for query_type in query_types:
+            if query_type not in STATUS_QUERY_TYPES:
+                raise ValueError(f"Unknown query type: '{query_type}'. "
+                               f"Available types: {list(STATUS_QUERY_TYPES.keys())}")
+            request_id, response_id, _ = STATUS_QUERY_TYPES[query_type]
+            requests.append((request_id, None, response_id))
+        
+        results = self.send_commands(requests, timeout=timeout)
+        
+        # Update statistics
+        query_stats = self.query_stats
+        for query_type, result in zip(query_types, results):
+            stats = query_stats[query_type]
+            stats['count'] += 1
+            if result is not None:
+                stats['success'] += 1
+            else:
+                stats['failed'] += 1
+        
+        return dict(zip(query_types, results))
+    
     def get_query_stats(self, query_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Get query statistics.
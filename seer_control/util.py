@@ -5,70 +5,179 @@ SEER Robot Utility Functions
 This module contains utility functions for SEER robot communication.
 """
 
-from typing import Dict, Any, Tuple, Optional
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Tuple, Optional, Union
 
+# Prefer the RE2 engine (DFA based, no backtracking) for bulk log parsing
+# when google-re2 is installed; the stdlib engine is used otherwise.
+try:
+    import re2 as _log_re
+except ImportError:
+    import re as _log_re
 
-def parse_command_line(line: str) -> Tuple[Optional[str], Dict[str, Any]]:
+# Parameter names that show up in most commands. Mapping parsed keys onto these
+# interned strings keeps downstream dict lookups on the identity fast path.
+_KNOWN_KEYS = {sys.intern(k): sys.intern(k) for k in (
+    'x', 'y', 'angle', 'vw', 'id', 'speed', 'vx', 'vy', 'mode',
+    'dist', 'target_id',
+)}
+
+# Accepted spellings of boolean values (command parameters are ASCII)
+_BOOL_MAP = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+}
+
+# Shared result for commands without parameters
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Command log grammar: "<func_name> key=value key=value ..." per line.
+# Lines are matched without their line terminator: under RE2, '$' only
+# matches at the very end of the text, not before a trailing newline.
+_LOG_LINE_RE = _log_re.compile(r'^\s*(\S+)(.*)$')
+_LOG_KV_RE = _log_re.compile(r'(?:^|\s)([^\s=]*)=(\S*)')
+
+
+def _convert_value(value: str, _int=int, _float=float, _bool_map=_BOOL_MAP) -> Any:
+    """
+    Convert a raw parameter value to bool, int, float or str.
+    
+    Values are classified by their first character so plain string values
+    (station IDs, names) never go through case folding or a failed float() parse.
+    The underscore arguments bind globals as fast locals and must not be passed.
+    
+    Args:
+        value: Raw value string (already stripped)
+        
+    Returns:
+        Converted value
+    """
+    c0 = value[:1]
+    if c0 in ('t', 'T', 'f', 'F') and value in _bool_map:
+        return _bool_map[value]
+    if c0 and c0 in '-+.0123456789':
+        # Try integer first (isdecimal: isdigit() also accepts e.g. '²', which int() rejects)
+        digits = value[1:] if c0 in '-+' else value
+        if digits.isdecimal():
+            return _int(value)
+        # Try float
+        try:
+            return _float(value)
+        except ValueError:
+            # Keep as string
+            return value
+    return value
+
+
+def parse_command_line(line: str, _partition=str.partition, _known_keys=_KNOWN_KEYS,
+                       _convert=_convert_value) -> Tuple[Optional[str], Mapping[str, Any]]:
     """
     Parse command line input into function name and parameters.
     
     Supports automatic type conversion for integers, floats, and booleans.
     All parameters are parsed as simple key=value pairs.
     
+    The parameters are returned as a read-only mapping so callers can pass
+    them on (e.g. ``func(**params)``) or cache them without defensive copies.
+    Use ``params.copy()`` to get a mutable dict.
+    
+    The underscore arguments bind globals as fast locals for the token loop
+    and must not be passed by callers.
+    
     Args:
         line: Command line string like "turn angle=3.14 vw=1"
         
     Returns:
-        Tuple of (function_name, parameters_dict)
-        Returns (None, {}) if line is empty
+        Tuple of (function_name, parameters_mapping)
+        Returns (None, {}) if line is empty (mapping is empty and read-only)
         
     Examples:
         >>> parse_command_line("stop")
-        ('stop', {})
+        ('stop', mappingproxy({}))
         
         >>> parse_command_line("turn angle=3.14 vw=1")
-        ('turn', {'angle': 3.14, 'vw': 1.0})
+        ('turn', mappingproxy({'angle': 3.14, 'vw': 1}))
         
         >>> parse_command_line("reloc x=0.0 y=0.0 angle=0.0")
-        ('reloc', {'x': 0.0, 'y': 0.0, 'angle': 0.0})
+        ('reloc', mappingproxy({'x': 0.0, 'y': 0.0, 'angle': 0.0}))
         
         >>> parse_command_line("gotarget id=Station1 x=1.0 y=2.0")
-        ('gotarget', {'id': 'Station1', 'x': 1.0, 'y': 2.0})
+        ('gotarget', mappingproxy({'id': 'Station1', 'x': 1.0, 'y': 2.0}))
     """
     parts = line.strip().split()
     if not parts:
-        return None, {}
+        return None, _NO_PARAMS
     
     func_name = parts[0]
+    if len(parts) == 1:
+        return func_name, _NO_PARAMS
+    
     params = {}
     
     for param in parts[1:]:
-        if '=' not in param:
+        key, sep, value = _partition(param, '=')
+        if not sep:
             continue
-        
-        key, value = param.split('=', 1)
+
         key = key.strip()
+        key = _known_keys.get(key, key)
         value = value.strip()
         
-        # Try to convert to appropriate type
-        try:
-            # Check for boolean values
-            if value.lower() == 'true':
-                params[key] = True
-            elif value.lower() == 'false':
-                params[key] = False
-            # Try integer first
-            elif '.' not in value and value.lstrip('-').isdigit():
-                params[key] = int(value)
-            else:
-                # Try float
-                try:
-                    params[key] = float(value)
-                except ValueError:
-                    # Keep as string
-                    params[key] = value
-        except (ValueError, AttributeError):
-            # Keep as string
-            params[key] = value
+        params[key] = _convert(value)
+    
+    return func_name, MappingProxyType(params)
+
+
+def parse_command_log(source: Union[str, bytes, bytearray, os.PathLike]
+                      ) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """
+    Parse a captured command log, one command per line.
+    
+    Intended for replaying large command logs. Lines are tokenized with
+    precompiled regular expressions (using the RE2 engine if google-re2 is
+    installed) and values are converted the same way as parse_command_line.
+    Blank lines are skipped.
+    
+    Args:
+        source: Path to a log file, or the raw log content as bytes
+        
+    Yields:
+        Tuples of (function_name, parameters_mapping), one per command line
+        
+    Examples:
+        >>> list(parse_command_log(b"stop\\ngotarget id=LM2 spin=true\\n"))
+        [('stop', mappingproxy({})), ('gotarget', mappingproxy({'id': 'LM2', 'spin': True}))]
+        
+        for func_name, params in parse_command_log("commands.log"):
+            getattr(robot.task, func_name)(**params)
+    """
+    if isinstance(source, (bytes, bytearray)):
+        lines = source.decode('utf-8').splitlines()
+        yield from _parse_log_lines(lines)
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from _parse_log_lines(f)
+
+
+def _parse_log_lines(lines) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """Tokenize an iterable of command log lines (see parse_command_log)."""
+    line_match = _LOG_LINE_RE.match
+    kv_findall = _LOG_KV_RE.findall
     
-    return func_name, params
+    for line in lines:
+        m = line_match(line.rstrip('\r\n'))
+        if m is None:
+            continue
+        
+        func_name, rest = m.group(1), m.group(2)
+        pairs = kv_findall(rest)
+        if not pairs:
+            yield func_name, _NO_PARAMS
+            continue
+        
+        params = {}
+        for key, value in pairs:
+            params[_KNOWN_KEYS.get(key, key)] = _convert_value(value)
+        yield func_name, MappingProxyType(params)
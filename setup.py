@@ -3,7 +3,7 @@
 Setup script for SEER Control package
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -15,7 +15,7 @@ setup(
     description="A comprehensive Python package for controlling SEER robots",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=["seer_control"],
     python_requires=">=3.6",
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -11,10 +11,225 @@ Date: October 22, 2025
 """
 
 from seer_control import SeerController
-from typing import Optional, Dict, Any, List
-import time
+from seer_control.seer_controller import TASK_STATUS_TEXT
+from typing import Optional, Dict, Any, List, Union, Callable, Mapping
+import asyncio
+import itertools
+import logging
+import os
+import re
 import threading
-from datetime import datetime
+import time
+import traceback
+from types import MappingProxyType
+
+
+_log = logging.getLogger(__name__)
+
+# Placeholder station ID meaning "the robot's current position"
+_SELF_POSITION = 'SELF_POSITION'
+
+# Short operation names for path descriptions (e.g. "JackLoad" -> "load")
+_OP_SHORT = {
+    'JackLoad': 'load',
+    'JackUnload': 'unload',
+    'JackHeight': 'height',
+    'Wait': 'wait',
+}
+
+# Task status code -> text (0 = NONE ... 6 = CANCELED)
+_TASK_STATUS_MAP = TASK_STATUS_TEXT
+
+
+# Fallback CLI parser tables (used when seer_control.util is unavailable)
+_KV_RE = re.compile(r'(?:^|\s)([^\s=]+)=(\S+)')  # Whole token before '=' is the key
+_FLOAT_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_LITERALS = {'true': True, 'false': False}
+# REPL commands that never take parameters (fallback parser fast path)
+_FAST_CMDS = frozenset({'exit', 'quit', 'q', 'help', 'task_status'})
+
+
+def _coerce(value: str) -> Any:
+    """
+    Convert a CLI parameter value to int or float if it looks like one, else keep the string.
+    
+    Integers are recognized with str.isdecimal() and floats are only pattern
+    matched when the value has a '.' or an exponent, so plain strings such as
+    station IDs never go through a failing int()/float() call.
+    """
+    digits = value[1:] if value[:1] in ('-', '+') else value
+    if digits.isdecimal():
+        return int(value)
+    if ('.' in value or 'e' in value or 'E' in value) and _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return value
+
+
+# Command line parser for main(), with a simple fallback if util is not available
+try:
+    from seer_control.util import parse_command_line
+except ImportError:
+    def parse_command_line(line):
+        """Simple command line parser fallback."""
+        stripped = line.strip()
+        if stripped in _FAST_CMDS:
+            return stripped, {}
+        parts = stripped.split(None, 1)
+        if not parts:
+            return None, {}
+        func_name = parts[0]
+        params = {}
+        if len(parts) > 1:
+            for key, val in _KV_RE.findall(parts[1]):
+                # Type conversion
+                lowered = val.lower()
+                params[key] = _LITERALS[lowered] if lowered in _LITERALS else _coerce(val)
+        return func_name, params
+
+
+def _silent(*args, **kwargs) -> None:
+    """Stand-in for _say() when verbose=False."""
+
+
+def _say(msg: str, *args) -> None:
+    """print() with lazy %-formatting: callers pass args so verbose=False (_silent) formats nothing."""
+    print(msg % args if args else msg)
+
+
+def _log_info(msg: str, *args) -> None:
+    """
+    Log at INFO for verbose=True calls.
+    
+    Prints the message instead when the application has not configured
+    logging (no handlers anywhere up the logger hierarchy), so verbose
+    output still appears in plain scripts.
+    """
+    if _log.hasHandlers():
+        _log.info(msg, *args)
+    else:
+        _say(msg, *args)
+
+
+def _log_debug(msg: str, *args) -> None:
+    """Log at DEBUG for verbose=False calls."""
+    _log.debug(msg, *args)
+
+
+def _format_charging(value: Any) -> str:
+    """Format the 'charging' push field for print_push_data()."""
+    return f"  Charging: {'Yes' if value else 'No'}"
+
+
+def _format_emergency(value: Any) -> str:
+    """Format the 'emergency' push field for print_push_data()."""
+    if value:
+        return "  🚨 Emergency: EMERGENCY"
+    return "  ✅ Emergency: Normal"
+
+
+def _format_task_status(value: Any) -> str:
+    """Format the 'task_status' push field for print_push_data()."""
+    return f"  Status: {_TASK_STATUS_MAP.get(value, 'UNKNOWN')} ({value})"
+
+
+def _iter_path(move_task_list: List[Dict[str, Any]]):
+    """
+    Yield the path entries of a move task list for gen_move_task_list_description().
+    
+    Consecutive duplicate stations and SELF_POSITION are left out; destinations
+    with an operation are annotated (e.g., "AP8 (load)").
+    """
+    self_position = _SELF_POSITION
+    previous_id = None
+    
+    for task in move_task_list:
+        # Get source and destination
+        source_id = task.get('source_id') or ''
+        dest_id = task.get('id') or ''
+        
+        # Add source to path if it's the first or different from previous
+        if source_id and source_id != self_position and source_id != previous_id:
+            yield source_id
+            previous_id = source_id
+        
+        # Add destination to path
+        if dest_id and dest_id != self_position:
+            operation = task.get('operation')
+            # Add operation annotation if present
+            if operation:
+                # Simplify operation name (e.g., "JackLoad" -> "load")
+                op_name = _OP_SHORT.get(operation) or operation.replace('Jack', '').lower()
+                yield f"{dest_id} ({op_name})"
+            else:
+                yield dest_id
+            previous_id = dest_id
+
+
+class MoveTaskPlan:
+    """
+    A move task list together with metadata derived from it once.
+    
+    Create plans with SmartSeerController.plan() and pass them to goto_start()
+    or execute_navigation() in place of the list. The task list is shared, not
+    copied, so create a new plan after modifying it.
+    
+    Attributes:
+        tasks: The move task list sent to the robot
+        start_position: First source_id that is not SELF_POSITION (None if none)
+        description: Human-readable path description (see gen_move_task_list_description)
+    """
+    __slots__ = ('tasks', 'start_position', 'description')
+    
+    def __init__(self, tasks: List[Dict[str, Any]], start_position: Optional[str], description: str):
+        self.tasks = tasks
+        self.start_position = start_position
+        self.description = description
+    
+    def __repr__(self) -> str:
+        return (f"MoveTaskPlan(start_position={self.start_position!r}, "
+                f"description={self.description!r}, tasks={len(self.tasks)})")
+
+
+class _TaskPollSchedule:
+    """
+    Polling interval state shared by the sync and async task wait loops.
+    
+    The interval starts at interval_min and drops back to it whenever the
+    task status changes or a push wakes the wait. Otherwise it grows by
+    backoff, up to push_interval_max while the push listener is running
+    and interval_max when it is not.
+    """
+    __slots__ = ('interval', 'interval_min', 'interval_max', 'push_interval_max', 'backoff',
+                 'last_status', 'push')
+    
+    def __init__(self, interval_min: float, interval_max: float, push_interval_max: float,
+                 backoff: float, push):
+        self.interval = interval_min
+        self.interval_min = interval_min
+        self.interval_max = interval_max
+        self.push_interval_max = push_interval_max
+        self.backoff = backoff
+        self.last_status = None
+        self.push = push
+    
+    def observe(self, task_status: Optional[int]) -> None:
+        """Poll fast right after a task status transition."""
+        if task_status is not None and task_status != self.last_status:
+            self.last_status = task_status
+            self.interval = self.interval_min
+    
+    def wait_time(self, remaining: float) -> float:
+        """Time to wait before the next poll, clamped to the remaining timeout."""
+        return max(0.0, min(self.interval, remaining))
+    
+    def after_wait(self, woken: bool) -> None:
+        """Update the interval after a wait; woken means a push signalled a change."""
+        if woken:
+            # Pushed task_status changed: re-query now, then poll fast
+            self.interval = self.interval_min
+        else:
+            interval_max = self.push_interval_max if self.push.listening else self.interval_max
+            self.interval = min(self.interval * self.backoff, interval_max)
 
 
 class SmartSeerController:
@@ -42,63 +257,178 @@ class SmartSeerController:
             if controller.is_connected:
                 controller.goto("LM5")
     """
+
+    # Kernel buffer sizes for the status/task/control sockets (small JSON frames only)
+    RPC_SNDBUF = 4096
+    RPC_RCVBUF = 8192
+
+    # Health check pacing for next_interval(), in seconds
+    HEALTH_INTERVAL_DEFAULT = 2.0
+    HEALTH_INTERVAL_MIN = 0.25
+    HEALTH_INTERVAL_MAX = 10.0
+    HEALTH_EWMA_ALPHA = 0.3  # Weight of the newest push gap sample
+
+    # Fields requested from the push controller (shared, immutable)
+    PUSH_FIELDS_DEFAULT = (
+        "x", "y", "angle", "current_station",
+        "vx", "vy", "w",
+        "battery_level", "charging",
+        "emergency", "soft_emc", "fatals", "errors", "warnings", "notices",
+        "create_on", "confidence",
+        "task_status", "task_type",
+        "jack"
+    )
     
+    # print_push_data() layout: (section header, ((key, formatter), ...))
+    _PRINT_SCHEMA = (
+        ("📍 Position:", (
+            ('x', "  X: {:.3f} m".format),
+            ('y', "  Y: {:.3f} m".format),
+            ('angle', "  Angle: {:.3f} rad".format),
+            ('current_station', "  Station: {}".format),
+            ('confidence', "  Confidence: {:.2f}".format),
+        )),
+        ("🏃 Velocity:", (
+            ('vx', "  Vx: {:.3f} m/s".format),
+            ('vy', "  Vy: {:.3f} m/s".format),
+            ('w', "  W: {:.3f} rad/s".format),
+        )),
+        ("🔋 Battery:", (
+            ('battery_level', "  Level: {}%".format),
+            ('charging', _format_charging),
+        )),
+        ("⚠️  Status:", (
+            ('emergency', _format_emergency),
+            ('fatals', "  Fatals: {}".format),
+            ('errors', "  Errors: {}".format),
+            ('warnings', "  Warnings: {}".format),
+            ('notices', "  Notices: {}".format),
+        )),
+        ("📊 Task:", (
+            ('task_status', _format_task_status),
+            ('task_type', "  Type: {}".format),
+        )),
+    )
+
     def __init__(
         self, 
         robot_ip: str,
+        tcp_nodelay: bool = True,
     ):
         """
         Initialize the Smart SEER Controller.
         
         Args:
             robot_ip: IP address of the SEER robot (e.g., "192.168.1.123")
+            tcp_nodelay: Disable Nagle's algorithm on the service sockets so small
+                         requests are sent immediately, and ACK replies without
+                         delay (TCP_QUICKACK, Linux only) (default: True)
         """
         # Connection settings
         self.robot_ip = robot_ip
+        self.tcp_nodelay = tcp_nodelay
         
         # Auto-charge configuration (configurable member parameters)
-        self.enable_auto_charge = True
+        self._enable_auto_charge = True  # See the enable_auto_charge property
         self.charge_point = 'CP0'
         self.pre_charge_point = 'LM2'
         self.warning_battery_percentage = 20.0
         self.charge_battery_percentage = 15.0
-        self._battery_monitor_thread: Optional[threading.Thread] = None
-        self._battery_monitor_stop_event = threading.Event()
+        self.battery_check_interval = 60.0  # seconds between battery checks
+        self._last_battery_check: Optional[float] = None  # time.monotonic() of last battery check (set by connect())
+        self._battery_event = threading.Event()  # Set by the push callback when a battery check is due
+        self._battery_thread: Optional[threading.Thread] = None  # Runs _do_battery_check() off the push thread
+        self._battery_stop: Optional[threading.Event] = None  # Stops the current battery worker
         
         # Push configuration
         self.push_interval = 1000  # milliseconds, 0 to disable
-        self.push_fields = [
-            "x", "y", "angle", "current_station",
-            "vx", "vy", "w",
-            "battery_level", "charging",
-            "emergency", "soft_emc", "fatals", "errors", "warnings", "notices",
-            "create_on", "confidence",
-            "task_status", "task_type",
-            "jack"
-        ]
-        self._push_data: Dict[str, Any] = {}
-        self._push_data_lock = threading.Lock()
-        self._last_push_time: Optional[float] = None  # Timestamp of last push data received
+        self.push_fields = self.PUSH_FIELDS_DEFAULT  # Assign a new tuple to customize
+        self._push_data: Mapping[str, Any] = MappingProxyType({})  # Read-only view of the latest snapshot
+        self._last_push_time: Optional[float] = None  # time.monotonic() of last push data received
+        self._push_task_status: Optional[int] = None  # Last task_status seen in push data
+        self._task_event = threading.Event()  # Set when the pushed task_status changes
+        self._push_active = False  # True while connect() has a push listener running
+        self._loc_cache = {'station': None, 'ts': 0.0}  # Last known current_station, ts is time.monotonic()
+        self._status_cache: Dict[str, tuple] = {}  # Status type -> (time.monotonic(), response), see _cached_query()
+        self._gap_ewma: Optional[float] = None  # Smoothed push gap seen by check_connection_health()
         
         # Internal state
         self.robot: Optional[SeerController] = None
         self.is_connected = False
-        self._task_id_counter = 0
-        self.last_navigation_time: Optional[float] = None  # Timestamp of last navigation call (time.time())
+        self._task_id_counter = itertools.count(1)  # next() is atomic under the GIL
+        self._task_id_stamp = (0, '')  # (epoch second, formatted timestamp) last used by _task_id_gen()
+        self.last_navigation_time: Optional[float] = None  # Timestamp of last navigation call (time.monotonic())
+        self._task_submit_time: Optional[float] = None  # time.monotonic() after the robot accepted the last task
     
     @property
-    def _push_timeout(self) -> float:
+    def enable_auto_charge(self) -> bool:
+        """Whether the push callback schedules auto-charge battery checks."""
+        return self._enable_auto_charge
+    
+    @enable_auto_charge.setter
+    def enable_auto_charge(self, value: bool) -> None:
+        """
+        Enable or disable auto-charge, starting or stopping the battery worker.
+        
+        The worker only runs while auto-charge is enabled and connect() has a
+        push listener running, so toggling this at runtime takes effect at once.
+        
+        Args:
+            value: True to enable auto-charge
+        """
+        self._enable_auto_charge = value
+        if not self._push_active:
+            return
+        if not value:
+            self._stop_battery_worker()
+        elif self._battery_thread is None:
+            self._start_battery_worker()
+    
+    @property
+    def push_interval(self) -> int:
+        """Push interval in milliseconds (0 disables push)."""
+        return self._push_interval
+    
+    @push_interval.setter
+    def push_interval(self, value: int) -> None:
         """
-        Calculate push timeout dynamically based on push interval.
+        Set the push interval and update the cached push timeout.
         
-        Timeout is push_interval (in seconds) + 5 seconds buffer.
+        The push timeout is push_interval (in seconds) + 5 seconds buffer.
         This ensures we allow enough time for push data to arrive
         even if there are network delays.
         
-        Returns:
-            Timeout in seconds
+        Args:
+            value: Push interval in milliseconds (0 to disable)
         """
-        return (self.push_interval / 1000.0) + 5.0
+        self._push_interval = value
+        self._push_timeout = (value / 1000.0) + 5.0
+    
+    @property
+    def push_fields(self) -> tuple:
+        """Fields requested from the push controller."""
+        return self._push_fields
+    
+    @push_fields.setter
+    def push_fields(self, value: tuple) -> None:
+        """
+        Set the push fields and rebuild the print_push_data() layout.
+        
+        Only the sections and fields that can appear in the push data are
+        kept, so printing does not test for fields that are never pushed.
+        
+        Args:
+            value: Field names to request (takes effect on the next connect)
+        """
+        wanted = frozenset(value)
+        print_groups = []
+        for header, fields in self._PRINT_SCHEMA:
+            fields = tuple((key, fmt) for key, fmt in fields if key in wanted)
+            if fields:
+                print_groups.append((header, fields))
+        
+        self._push_fields = value
+        self._print_groups = tuple(print_groups)
     
     def connect(self, verbose: bool = True, timeout: float = 5.0) -> bool:
         """
@@ -108,8 +438,10 @@ class SmartSeerController:
         control interfaces, and push controller (if push_interval > 0).
         
         Args:
-            verbose: If True, prints connection status messages (default: True)
-            timeout: Connection timeout in seconds (default: 5.0)
+            verbose: If True, logs connection status messages at INFO level
+                     instead of DEBUG; they are printed if logging is not
+                     configured (default: True)
+            timeout: Overall connection timeout in seconds for all services (default: 5.0)
             
         Returns:
             True if connected successfully to at least one service, False otherwise
@@ -122,69 +454,37 @@ class SmartSeerController:
             # Silent connection with custom timeout
             controller.connect(verbose=False, timeout=10.0)
         """
-        if verbose:
-            print(f"\n🔌 Connecting to robot at {self.robot_ip}...")
-        
-        # Use a threading approach to implement timeout
-        connection_result = {'success': False, 'connections': None, 'error': None}
+        log = _log_info if verbose else _log_debug
+        log("\n🔌 Connecting to robot at %s...", self.robot_ip)
         
-        def _do_connect():
-            try:
-                self.robot = SeerController(self.robot_ip)
-                connections = self.robot.connect_all()
-                connection_result['success'] = True
-                connection_result['connections'] = connections
-            except Exception as e:
-                connection_result['error'] = e
-        
-        # Start connection in a separate thread
-        connect_thread = threading.Thread(target=_do_connect, daemon=True)
-        connect_thread.start()
-        connect_thread.join(timeout=timeout)
-        
-        # Check if connection completed within timeout
-        if connect_thread.is_alive():
-            # Connection timed out
-            if verbose:
-                print(f"\n❌ Connection timeout after {timeout} seconds")
-            self.robot = None
-            self.is_connected = False
-            return False
-        
-        # Check if connection had an error
-        if connection_result['error']:
-            if verbose:
-                print(f"\n❌ Connection error: {connection_result['error']}")
-            self.robot = None
-            self.is_connected = False
-            return False
-        
-        # Check if connection succeeded
-        if not connection_result['success']:
-            if verbose:
-                print("\n❌ Connection failed")
+        # connect_all() shares one deadline across the service sockets
+        try:
+            self.robot = SeerController(self.robot_ip)
+            self._configure_services()
+            connections = self.robot.connect_all(timeout=timeout)
+        except Exception as e:
+            log("\n❌ Connection error: %s", e)
             self.robot = None
             self.is_connected = False
             return False
         
-        connections = connection_result['connections']
+        # Status lines are collected and logged as one record
+        lines = ["", "📊 Connection Status:"]
+        for service, connected in connections.items():
+            if connected:
+                lines.append(f"  ✅ {service}: Connected")
+            else:
+                lines.append(f"  ❌ {service}: Disconnected")
         
         try:
-            if verbose:
-                print("\n📊 Connection Status:")
-                for service, connected in connections.items():
-                    status_icon = "✅" if connected else "❌"
-                    status_text = 'Connected' if connected else 'Disconnected'
-                    print(f"  {status_icon} {service}: {status_text}")
-            
             # Check if at least one service is connected
             self.is_connected = any(connections.values())
             
             if self.is_connected:
                 # Enable push controller if push_interval > 0
                 if self.push_interval > 0 and connections.get('push', False):
-                    if verbose:
-                        print(f"\n⚡ Configuring push controller (interval: {self.push_interval}ms)...")
+                    lines.append("")
+                    lines.append(f"⚡ Configuring push controller (interval: {self.push_interval}ms)...")
                     
                     result = self.robot.push.configure_push(
                         interval=self.push_interval,
@@ -192,43 +492,103 @@ class SmartSeerController:
                     )
                     
                     if result and result.get('ret_code') == 0:
-                        if verbose:
-                            print("   ✅ Push configured successfully")
-                        
-                        # Start listening with callback
-                        if verbose:
-                            print("   🎧 Starting push listener...")
+                        lines.append("   ✅ Push configured successfully")
                         
+                        # Start listening with callback (first battery check one interval from now)
+                        self._last_battery_check = time.monotonic()
                         if self.robot.push.start_listening(callback=self._push_data_callback):
-                            if verbose:
-                                print("   ✅ Push listener started")
+                            self._push_active = True
+                            lines.append("   ✅ Push listener started")
                         else:
-                            if verbose:
-                                print("   ⚠️  Failed to start push listener")
+                            lines.append("   ⚠️  Failed to start push listener")
                     else:
-                        if verbose:
-                            print("   ⚠️  Push configuration failed")
+                        lines.append("   ⚠️  Push configuration failed")
                 
-                # Start battery monitoring thread if auto-charge is enabled
-                if self.enable_auto_charge:
-                    self._start_battery_monitor(verbose=verbose)
+                # Battery checks are scheduled by the push callback, so the
+                # worker is only needed while push is active and auto-charge is on
+                if self._push_active and self.enable_auto_charge:
+                    self._start_battery_worker()
+                    lines.append("   🔋 Battery monitor enabled")
                 
-                if verbose:
-                    print("\n✅ Connected successfully!")
+                lines.append("")
+                lines.append("✅ Connected successfully!")
+                log("\n".join(lines))
                 return True
             else:
-                if verbose:
-                    print("\n❌ Failed to connect to any services")
+                lines.append("")
+                lines.append("❌ Failed to connect to any services")
+                log("\n".join(lines))
                 self.robot = None
                 return False
                 
         except Exception as e:
-            if verbose:
-                print(f"\n❌ Connection error: {e}")
+            log("\n❌ Connection error: %s", e)
             self.robot = None
             self.is_connected = False
             return False
     
+    def _configure_services(self) -> None:
+        """
+        Set the socket options the service controllers apply when they connect.
+        
+        The status, task and control services only exchange small JSON frames
+        and get small kernel buffers (RPC_SNDBUF / RPC_RCVBUF). Config (map and
+        model uploads/downloads), other and push keep kernel autotuning, since
+        buffers set before connect fix the TCP window scale for the whole
+        connection. Because the options are applied in connect(), they also
+        hold for sockets reopened by a lazy reconnect.
+        """
+        robot = self.robot
+        small_frame_services = (robot.status, robot.task, robot.control)
+        for service in small_frame_services + (robot.config, robot.other, robot.push):
+            service.tcp_nodelay = self.tcp_nodelay
+            service.quick_ack = self.tcp_nodelay
+        for service in small_frame_services:
+            service.sndbuf = self.RPC_SNDBUF
+            service.rcvbuf = self.RPC_RCVBUF
+    
+    def _start_battery_worker(self) -> None:
+        """
+        Start the thread that runs the auto-charge battery checks.
+        
+        The check queries the lock state, locks control and starts navigation,
+        so it must not run on the push listener thread: push intake would stop
+        for the length of those requests. The push callback only sets
+        _battery_event; this worker waits on it and runs _do_battery_check()
+        with the latest push snapshot.
+        """
+        self._stop_battery_worker()
+        self._battery_event.clear()
+        stop = self._battery_stop = threading.Event()
+        self._battery_thread = threading.Thread(
+            target=self._battery_worker_loop,
+            args=(stop,),
+            daemon=True,
+            name="BatteryMonitor"
+        )
+        self._battery_thread.start()
+    
+    def _stop_battery_worker(self) -> None:
+        """Stop the battery worker thread, if running."""
+        thread, stop = self._battery_thread, self._battery_stop
+        self._battery_thread = self._battery_stop = None
+        if thread is None:
+            return
+        stop.set()
+        self._battery_event.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+    
+    def _battery_worker_loop(self, stop: threading.Event) -> None:
+        """Run a battery check each time _battery_event is set, until stop is set."""
+        event = self._battery_event
+        while True:
+            event.wait()
+            if stop.is_set():
+                return
+            event.clear()
+            self._do_battery_check(self._push_data)
+    
     def disconnect(self, verbose: bool = True) -> bool:
         """
         Disconnect from the SEER robot.
@@ -236,7 +596,9 @@ class SmartSeerController:
         Closes all connections to robot services and cleans up resources.
         
         Args:
-            verbose: If True, prints disconnection status messages (default: True)
+            verbose: If True, logs disconnection status messages at INFO level
+                     instead of DEBUG; they are printed if logging is not
+                     configured (default: True)
             
         Returns:
             True if disconnected successfully, False if not connected
@@ -247,33 +609,30 @@ class SmartSeerController:
             # Silent disconnection
             controller.disconnect(verbose=False)
         """
+        log = _log_info if verbose else _log_debug
         if self.robot is None:
-            if verbose:
-                print("⚠️  Not connected to any robot")
+            log("⚠️  Not connected to any robot")
             return False
         
         try:
-            if verbose:
-                print("\n🔌 Disconnecting from robot...")
-            
-            # Stop battery monitoring thread if running
-            self._stop_battery_monitor(verbose=verbose)
-            
-            # Stop push listener if running
-            if hasattr(self.robot, 'push') and self.robot.push.listening:
+            # Stop push listener if connect() started it
+            if self._push_active:
+                self._push_active = False
                 self.robot.push.stop_listening()
+            self._stop_battery_worker()
             
             self.robot.disconnect_all()
             self.robot = None
             self.is_connected = False
+            self._gap_ewma = None
+            self._loc_cache = {'station': None, 'ts': 0.0}
+            self._status_cache = {}
             
-            if verbose:
-                print("✅ Disconnected successfully")
+            log("\n🔌 Disconnecting from robot...\n✅ Disconnected successfully")
             return True
             
         except Exception as e:
-            if verbose:
-                print(f"❌ Disconnection error: {e}")
+            log("❌ Disconnection error: %s", e)
             return False
     
     def _cleanup_robot(self) -> None:
@@ -284,19 +643,15 @@ class SmartSeerController:
         reconnection attempts will create a fresh connection.
         """
         try:
-            # Stop battery monitoring thread first (CRITICAL to prevent thread leak)
-            try:
-                self._stop_battery_monitor(verbose=False)
-            except Exception:
-                pass  # Ignore errors during cleanup
-            
             if self.robot:
-                # Try to stop push listener if it's running
-                if hasattr(self.robot, 'push') and hasattr(self.robot.push, 'stop_listening'):
+                # Try to stop push listener if connect() started it
+                if self._push_active:
+                    self._push_active = False
                     try:
                         self.robot.push.stop_listening()
                     except Exception:
                         pass  # Ignore errors during cleanup
+                self._stop_battery_worker()
                 
                 # Try to disconnect all services
                 try:
@@ -306,6 +661,9 @@ class SmartSeerController:
                 
                 self.robot = None
                 self._last_push_time = None  # Reset push timestamp
+                self._gap_ewma = None
+                self._loc_cache = {'station': None, 'ts': 0.0}
+                self._status_cache = {}
         except Exception:
             pass  # Ignore any cleanup errors
     
@@ -324,8 +682,13 @@ class SmartSeerController:
         Note: If no push data has been received yet (_last_push_time is None),
         the connection is still considered healthy as we may have just connected.
         
+        Each check also feeds the time since the last push into a moving
+        average that next_interval() uses to pace periodic checks.
+        
         Args:
-            verbose: If True, prints debug information about connection health checks
+            verbose: If True, logs connection health details at INFO level
+                     instead of DEBUG; they are printed if logging is not
+                     configured
         
         Returns:
             True if connection is healthy, False if connection is lost
@@ -335,167 +698,186 @@ class SmartSeerController:
                 print("Connection lost!")
                 controller.disconnect()
         """
+        log = _log_info if verbose else _log_debug
+        robot = self.robot
+        
         # Not connected at all
-        if not self.is_connected or self.robot is None:
-            if verbose:
-                print(f"Health check: Not connected (is_connected={self.is_connected}, robot={self.robot is not None})")
+        if robot is None or not self.is_connected:
+            log("Health check: Not connected (is_connected=%s, robot=%s)",
+                self.is_connected, robot is not None)
             return False
         
         # Check if push controller detected disconnection
-        if hasattr(self.robot, 'push'):
-            push_connected = self.robot.push.connected
-            if verbose:
-                print(f"Health check: Push controller connected={push_connected}")
-            if not push_connected:
-                self.is_connected = False
-                if verbose:
-                    print("Health check: FAILED - Push controller disconnected")
-                # Clean up robot object to allow reconnection
-                self._cleanup_robot()
-                return False
+        # (SeerController always creates its push controller)
+        push_connected = robot.push.connected and robot.push.socket is not None
+        log("Health check: Push controller connected=%s", push_connected)
+        if not push_connected:
+            self.is_connected = False
+            log("Health check: FAILED - Push controller disconnected")
+            # Clean up robot object to allow reconnection
+            self._cleanup_robot()
+            return False
         
         # Check if push data is stale (only if we have received push data before)
         # If _last_push_time is None, we haven't received data yet, which is OK for a new connection
-        if self.push_interval > 0 and self._last_push_time is not None:
-            time_since_last_push = time.time() - self._last_push_time
-            if verbose:
-                print(f"Health check: Time since last push={time_since_last_push:.2f}s, timeout={self._push_timeout:.2f}s")
-            if time_since_last_push > self._push_timeout:
+        last_push_time = self._last_push_time
+        if self._push_interval > 0 and last_push_time is not None:
+            push_timeout = self._push_timeout
+            time_since_last_push = time.monotonic() - last_push_time
+            log("Health check: Time since last push=%.2fs, timeout=%.2fs",
+                time_since_last_push, push_timeout)
+            gap_ewma = self._gap_ewma
+            if gap_ewma is None:
+                self._gap_ewma = time_since_last_push
+            else:
+                alpha = self.HEALTH_EWMA_ALPHA
+                self._gap_ewma = gap_ewma + alpha * (time_since_last_push - gap_ewma)
+            if time_since_last_push > push_timeout:
                 # No push data received for too long - connection likely lost
                 self.is_connected = False
-                if verbose:
-                    print(f"Health check: FAILED - Push data stale ({time_since_last_push:.2f}s > {self._push_timeout:.2f}s)")
+                log("Health check: FAILED - Push data stale (%.2fs > %.2fs)",
+                    time_since_last_push, push_timeout)
                 # Clean up robot object to allow reconnection
                 self._cleanup_robot()
                 return False
-        elif verbose:
-            print(f"Health check: Last push time={self._last_push_time} (None = no data yet)")
+        else:
+            log("Health check: Last push time=%s (None = no data yet)", last_push_time)
         
-        if verbose:
-            print("Health check: PASSED")
+        log("Health check: PASSED")
         return True
     
-    def _push_data_callback(self, data: Dict[str, Any]) -> None:
+    def next_interval(self) -> float:
         """
-        Callback function for push data (thread-safe).
+        Get the recommended delay before the next check_connection_health() call.
         
-        This is called by the push controller in a background thread.
-        Updates the internal push data storage in a thread-safe manner.
-        Also updates the timestamp for connection health monitoring.
+        The baseline is the push interval: while pushes arrive on time the
+        smoothed push gap seen by the health checks stays below it and checks
+        are spaced out (up to HEALTH_INTERVAL_MAX, but never beyond the push
+        timeout). When pushes start to lag, the interval shrinks towards
+        HEALTH_INTERVAL_MIN so a lost connection is detected quickly.
         
-        Args:
-            data: Push data dictionary received from robot
+        Returns:
+            Delay in seconds; HEALTH_INTERVAL_DEFAULT until a push gap has
+            been measured or when push is disabled
         """
-        with self._push_data_lock:
-            self._push_data = data.copy()
-            self._last_push_time = time.time()
-            
-            # Check if push controller detected disconnection
-            if self.robot and self.robot.push and not self.robot.push.connected:
-                self.is_connected = False
+        gap_ewma = self._gap_ewma
+        if self._push_interval <= 0 or gap_ewma is None:
+            return self.HEALTH_INTERVAL_DEFAULT
+        upper = min(self.HEALTH_INTERVAL_MAX, self._push_timeout)
+        if gap_ewma <= 0:
+            return upper
+        interval = 2.0 * (self._push_interval / 1000.0) / gap_ewma
+        return max(self.HEALTH_INTERVAL_MIN, min(upper, interval))
     
-    def _start_battery_monitor(self, verbose: bool = True) -> None:
+    def _push_data_callback(self, data: Dict[str, Any]) -> None:
         """
-        Start the battery monitoring thread for auto-charge functionality.
+        Callback function for push data.
+        
+        This is called by the push controller in a background thread.
+        Each push message is a freshly parsed dict owned by this callback, so
+        it is published as a read-only view without copying; the single
+        attribute assignment is atomic, so readers always see a complete
+        snapshot without locking.
+        Also updates the timestamp for connection health monitoring, wakes
+        any task wait when the pushed task_status changes, and wakes the
+        battery worker every battery_check_interval seconds.
         
         Args:
-            verbose: If True, prints status messages
+            data: Push data dictionary received from robot
         """
-        if self._battery_monitor_thread and self._battery_monitor_thread.is_alive():
-            if verbose:
-                print("   ⚠️  Battery monitor already running")
-            return
+        now = time.monotonic()
+        self._last_push_time = now
+        self._push_data = MappingProxyType(data)
         
-        self._battery_monitor_stop_event.clear()
-        self._battery_monitor_thread = threading.Thread(
-            target=self._battery_monitor_loop,
-            daemon=True,
-            name="BatteryMonitor"
-        )
-        self._battery_monitor_thread.start()
+        # Keep the last known station fresh for goto()'s "already there" check
+        station = data.get('current_station')
+        if station is not None:
+            self._loc_cache = {'station': station, 'ts': now}
         
-        if verbose:
-            print("   🔋 Battery monitor started")
-    
-    def _stop_battery_monitor(self, verbose: bool = True) -> None:
-        """
-        Stop the battery monitoring thread.
+        # Wake _wait_task_complete() so it confirms the new state right away
+        task_status = data.get('task_status')
+        if task_status != self._push_task_status:
+            self._push_task_status = task_status
+            self._task_event.set()
         
-        Args:
-            verbose: If True, prints status messages
-        """
-        if self._battery_monitor_thread and self._battery_monitor_thread.is_alive():
-            self._battery_monitor_stop_event.set()
-            self._battery_monitor_thread.join(timeout=2.0)
-            if verbose:
-                print("   🔋 Battery monitor stopped")
+        # Check if push controller detected disconnection
+        if self.robot and self.robot.push and not self.robot.push.connected:
+            self.is_connected = False
+        
+        # Schedule the periodic battery check on the battery worker (never run
+        # it here: its requests would stall push intake)
+        last_battery_check = self._last_battery_check
+        if (self.enable_auto_charge and last_battery_check is not None
+                and now - last_battery_check >= self.battery_check_interval):
+            self._last_battery_check = now
+            self._battery_event.set()
     
-    def _battery_monitor_loop(self) -> None:
+    def _do_battery_check(self, data: Mapping[str, Any]) -> None:
         """
-        Battery monitoring loop that runs in a background thread.
+        Battery check for auto-charge functionality.
         
-        Checks battery level every minute and:
+        Runs on the battery worker thread every battery_check_interval seconds
+        (scheduled by the push callback) and:
         - Plays warning audio if battery < warning_battery_percentage and not charging
         - Triggers auto-charge if battery < charge_battery_percentage and not charging
+        
+        Args:
+            data: Latest push data dictionary
         """
-        while not self._battery_monitor_stop_event.wait(60):  # Check every 60 seconds
-            try:
-                if not self.is_connected or self.robot is None:
-                    continue
-                
-                # Get current push data
-                push_data = self.get_push_data()
-                if not push_data:
-                    continue
-                
-                battery_level = push_data.get('battery_level', 1.0) * 100  # Convert to percentage
-                is_charging = push_data.get('charging', False)
-                task_status = push_data.get('task_status', 0)  # 0=NONE, 2=RUNNING
-                current_station = push_data.get('current_station', '')
-                
-                # Skip warnings and charging if robot is already charging
-                if is_charging:
-                    print(f"   🔌 Robot is currently charging, current battery level: {battery_level:.1f}%")
-                    continue
-                
-                # Play warning audio every iteration if battery is below warning threshold
-                if battery_level < self.warning_battery_percentage:
-                    self._play_warning_audio()
-                    print(f"⚠️  Battery warning: {battery_level:.1f}% (threshold: {self.warning_battery_percentage}%)")
-                
-                # Auto-charge logic: only trigger if battery critical and robot is not running a task
-                if battery_level < self.charge_battery_percentage and task_status != 2:
-                    print(f"🔋 Battery critical: {battery_level:.1f}% (threshold: {self.charge_battery_percentage}%)")
-
-                    # check whether control is locked by others
-                    current_lock = self.robot.status.query_status(query_type="current_lock")
-                    if current_lock and current_lock.get('locked', False):
-                        print("   🔒 Control is locked by another controller, force lock by us")
-                        self.robot.config.lock(nick_name="auto_charge")
+        try:
+            if not self.is_connected or self.robot is None:
+                return
+            
+            battery_level = data.get('battery_level', 1.0) * 100  # Convert to percentage
+            is_charging = data.get('charging', False)
+            task_status = data.get('task_status', 0)  # 0=NONE, 2=RUNNING
+            current_station = data.get('current_station', '')
+            
+            # Skip warnings and charging if robot is already charging
+            if is_charging:
+                _log.info("   🔌 Robot is currently charging, current battery level: %.1f%%", battery_level)
+                return
+            
+            # Play warning audio on every check while battery is below warning threshold
+            if battery_level < self.warning_battery_percentage:
+                self._play_warning_audio()
+                _log.warning("⚠️  Battery warning: %.1f%% (threshold: %s%%)",
+                             battery_level, self.warning_battery_percentage)
+            
+            # Auto-charge logic: only trigger if battery critical and robot is not running a task
+            if battery_level < self.charge_battery_percentage and task_status != 2:
+                _log.warning("🔋 Battery critical: %.1f%% (threshold: %s%%)",
+                             battery_level, self.charge_battery_percentage)
+
+                # check whether control is locked by others
+                current_lock = self.robot.status.query_status(query_type="current_lock")
+                if current_lock and current_lock.get('locked', False):
+                    _log.info("   🔒 Control is locked by another controller, force lock by us")
+                    self.robot.config.lock(nick_name="auto_charge")
+                else:
+                    _log.info("   🔓 Control is free, proceeding to auto-charge")
+
+                # Check current location and navigate step-by-step
+                if current_station != self.pre_charge_point:
+                    # Not at pre-charge or charge point, go to pre-charge point first
+                    _log.info("📍 Navigating to pre-charge point: %s (non-blocking)", self.pre_charge_point)
+                    result = self.robot.task.gotarget(id=self.pre_charge_point)
+                    if result and result.get('ret_code') == 0:
+                        _log.info("   ✅ Navigation to pre-charge point started (Task ID: %s)", result.get('task_id'))
                     else:
-                        print("   🔓 Control is free, proceeding to auto-charge")
-
-                    # Check current location and navigate step-by-step
-                    if current_station != self.pre_charge_point:
-                        # Not at pre-charge or charge point, go to pre-charge point first
-                        print(f"📍 Navigating to pre-charge point: {self.pre_charge_point} (non-blocking)")
-                        result = self.robot.task.gotarget(id=self.pre_charge_point)
-                        if result and result.get('ret_code') == 0:
-                            print(f"   ✅ Navigation to pre-charge point started (Task ID: {result.get('task_id')})")
-                        else:
-                            print("   ❌ Failed to start navigation to pre-charge point")
-                    
+                        _log.error("   ❌ Failed to start navigation to pre-charge point")
+                
+                else:
+                    # At pre-charge point, now go to charge point with recognize and wait
+                    _log.info("🔌 Navigating to charge point: %s (recognize=True, operation='wait')", self.charge_point)
+                    result = self.robot.task.gotarget(id=self.charge_point, recognize=True, operation="wait")
+                    if result and result.get('ret_code') == 0:
+                        _log.info("   ✅ Navigation to charge point started (Task ID: %s)", result.get('task_id'))
                     else:
-                        # At pre-charge point, now go to charge point with recognize and wait
-                        print(f"🔌 Navigating to charge point: {self.charge_point} (recognize=True, operation='wait')")
-                        result = self.robot.task.gotarget(id=self.charge_point, recognize=True, operation="wait")
-                        if result and result.get('ret_code') == 0:
-                            print(f"   ✅ Navigation to charge point started (Task ID: {result.get('task_id')})")
-                        else:
-                            print("   ❌ Failed to start navigation to charge point")
-                    
-            except Exception as e:
-                print(f"❌ Battery monitor error: {e}")
+                        _log.error("   ❌ Failed to start navigation to charge point")
+                
+        except Exception as e:
+            _log.error("❌ Battery monitor error: %s", e)
     
     def _play_warning_audio(self) -> None:
         """
@@ -507,11 +889,11 @@ class SmartSeerController:
                 # You'll need to adjust this based on the actual API
                 result = self.robot.other.play_audio(name="lowBattery")
                 if result and result.get('ret_code') == 0:
-                    print("🔊 Warning audio played")
+                    _log.info("🔊 Warning audio played")
                 else:
-                    print("⚠️  Failed to play warning audio")
+                    _log.warning("⚠️  Failed to play warning audio")
         except Exception as e:
-            print(f"❌ Error playing warning audio: {e}")
+            _log.error("❌ Error playing warning audio: %s", e)
     
     def __enter__(self):
         """Context manager entry - connects to robot."""
@@ -552,41 +934,42 @@ class SmartSeerController:
         if not move_task_list:
             return "Empty task list"
         
-        path_parts = []
-        previous_id = None
+        # Join with arrow symbol
+        return ' → '.join(_iter_path(move_task_list)) or "Navigation task"
+    
+    def plan(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan]) -> MoveTaskPlan:
+        """
+        Get the MoveTaskPlan for a move task list.
         
-        for task in move_task_list:
-            # Get source and destination
-            source_id = task.get('source_id', '')
-            dest_id = task.get('id', '')
-            operation = task.get('operation', '')
-            
-            # Skip SELF_POSITION entries in the path
-            if source_id == 'SELF_POSITION' and dest_id == 'SELF_POSITION':
-                continue
+        The start position and description are computed when the plan is
+        created. Hold on to the plan and pass it to goto_start() and
+        execute_navigation() so the list is not rescanned on each call.
+        
+        Args:
+            move_task_list: List of waypoints/tasks, or an existing MoveTaskPlan
             
-            # Add source to path if it's the first or different from previous
-            if source_id and source_id != 'SELF_POSITION' and source_id != previous_id:
-                path_parts.append(source_id)
-                previous_id = source_id
+        Returns:
+            MoveTaskPlan for the list (the argument itself if it is already a plan)
             
-            # Add destination to path
-            if dest_id and dest_id != 'SELF_POSITION':
-                # Add operation annotation if present
-                if operation:
-                    # Simplify operation name (e.g., "JackLoad" -> "load")
-                    op_name = operation.replace('Jack', '').lower()
-                    path_parts.append(f"{dest_id} ({op_name})")
-                else:
-                    path_parts.append(dest_id)
-                previous_id = dest_id
+        Examples:
+            plan = controller.plan(move_task_list)
+            controller.goto_start(plan)
+            controller.execute_navigation(plan)
+        """
+        if isinstance(move_task_list, MoveTaskPlan):
+            return move_task_list
         
-        # Join with arrow symbol
-        if path_parts:
-            return ' → '.join(path_parts)
-        else:
-            return "Navigation task"
-    
+        # Find the first source_id that is not SELF_POSITION
+        start_position = None
+        for task in move_task_list:
+            source_id = task.get('source_id')
+            if source_id and source_id != _SELF_POSITION:
+                start_position = source_id
+                break
+        
+        return MoveTaskPlan(move_task_list, start_position,
+                            self.gen_move_task_list_description(move_task_list))
+
     def _task_id_gen(self) -> str:
         """
         Generate a unique task ID.
@@ -597,9 +980,15 @@ class SmartSeerController:
         Returns:
             Unique task ID string
         """
-        self._task_id_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"{timestamp}_{self._task_id_counter}"
+        n = next(self._task_id_counter)
+        
+        # The timestamp only changes once per second; format it once per second
+        sec = int(time.time())
+        stamp_sec, stamp = self._task_id_stamp
+        if sec != stamp_sec:
+            stamp = time.strftime('%Y%m%d%H%M%S', time.localtime(sec))
+            self._task_id_stamp = (sec, stamp)
+        return f"{stamp}_{n}"
     
     def get_idle_time(self) -> Optional[float]:
         """
@@ -607,6 +996,8 @@ class SmartSeerController:
         
         Calculates the time elapsed since the last navigation method was called.
         This is useful for tracking robot idle time and scheduling decisions.
+        Both ends are time.monotonic() readings, so the result never goes
+        negative or jumps when the system clock is adjusted.
         
         Returns:
             Time in seconds since last navigation call, or None if no navigation has been called yet
@@ -623,17 +1014,20 @@ class SmartSeerController:
         """
         if self.last_navigation_time is None:
             return None
-        return time.time() - self.last_navigation_time
+        return time.monotonic() - self.last_navigation_time
     
-    def get_push_data(self) -> Dict[str, Any]:
+    def get_push_data(self) -> Mapping[str, Any]:
         """
         Get the latest push data (thread-safe).
         
-        Returns a copy of the most recent push data received from the robot.
-        This method is thread-safe and can be called from any thread.
+        Returns a read-only view of the most recent push data snapshot received
+        from the robot, without copying it. The snapshot is replaced as a whole
+        on every push. Call .copy() (or dict()) on it to get a modifiable dict,
+        e.g. before JSON serialization. This method can be called from any thread.
         
         Returns:
-            Dictionary containing the latest push data, or empty dict if no data received yet
+            Read-only mapping containing the latest push data, or an empty
+            mapping if no data received yet
             
         Examples:
             # Get latest push data
@@ -641,8 +1035,7 @@ class SmartSeerController:
             print(f"Position: ({data.get('x')}, {data.get('y')})")
             print(f"Battery: {data.get('battery_level')}%")
         """
-        with self._push_data_lock:
-            return self._push_data.copy()
+        return self._push_data
     
     def print_push_data(self) -> bool:
         """
@@ -663,89 +1056,43 @@ class SmartSeerController:
             print("⚠️  No push data received yet")
             return False
         
-        print("\n" + "="*60)
-        print("📡 Push Data")
-        print("="*60)
+        lines = ["", "="*60, "📡 Push Data", "="*60]
         
-        # Position data
-        if any(k in data for k in ['x', 'y', 'angle', 'current_station']):
-            print("\n📍 Position:")
-            if 'x' in data:
-                print(f"  X: {data['x']:.3f} m")
-            if 'y' in data:
-                print(f"  Y: {data['y']:.3f} m")
-            if 'angle' in data:
-                print(f"  Angle: {data['angle']:.3f} rad")
-            if 'current_station' in data:
-                print(f"  Station: {data['current_station']}")
-            if 'confidence' in data:
-                print(f"  Confidence: {data['confidence']:.2f}")
-        
-        # Velocity data
-        if any(k in data for k in ['vx', 'vy', 'w']):
-            print("\n🏃 Velocity:")
-            if 'vx' in data:
-                print(f"  Vx: {data['vx']:.3f} m/s")
-            if 'vy' in data:
-                print(f"  Vy: {data['vy']:.3f} m/s")
-            if 'w' in data:
-                print(f"  W: {data['w']:.3f} rad/s")
-        
-        # Battery data
-        if any(k in data for k in ['battery_level', 'charging']):
-            print("\n🔋 Battery:")
-            if 'battery_level' in data:
-                print(f"  Level: {data['battery_level']}%")
-            if 'charging' in data:
-                print(f"  Charging: {'Yes' if data['charging'] else 'No'}")
-        
-        # Status indicators
-        if any(k in data for k in ['emergency', 'fatals', 'errors', 'warnings', 'notices']):
-            print("\n⚠️  Status:")
-            if 'emergency' in data:
-                status_text = "EMERGENCY" if data['emergency'] else "Normal"
-                icon = "🚨" if data['emergency'] else "✅"
-                print(f"  {icon} Emergency: {status_text}")
-            if 'fatals' in data:
-                print(f"  Fatals: {data['fatals']}")
-            if 'errors' in data:
-                print(f"  Errors: {data['errors']}")
-            if 'warnings' in data:
-                print(f"  Warnings: {data['warnings']}")
-            if 'notices' in data:
-                print(f"  Notices: {data['notices']}")
-        
-        # Task data
-        if any(k in data for k in ['task_status', 'task_type']):
-            print("\n📊 Task:")
-            if 'task_status' in data:
-                status_map = {
-                    0: "NONE", 1: "WAITING", 2: "RUNNING", 3: "SUSPENDED",
-                    4: "COMPLETED", 5: "FAILED", 6: "CANCELED"
-                }
-                status_text = status_map.get(data['task_status'], "UNKNOWN")
-                print(f"  Status: {status_text} ({data['task_status']})")
-            if 'task_type' in data:
-                print(f"  Type: {data['task_type']}")
+        for header, fields in self._print_groups:
+            section = [fmt(data[key]) for key, fmt in fields if key in data]
+            if section:
+                lines.append("")
+                lines.append(header)
+                lines.extend(section)
         
         # Timestamp
         if 'create_on' in data:
-            print(f"\n🕐 Timestamp: {data['create_on']}")
+            lines.append("")
+            lines.append(f"🕐 Timestamp: {data['create_on']}")
         
-        print("="*60)
+        lines.append("="*60)
+        print("\n".join(lines))
         return True
 
     # ========================================================================
     # General Navigation Methods
     # ========================================================================
     
-    def task_status(self) -> int:
+    def task_status(self, force_poll: bool = False) -> int:
         """
         Query the status of the current running task.
         
         This method is useful for non-blocking workflows where you start a task
         and then periodically check its status until completion.
         
+        While the push listener is running, the status is read from the latest
+        push data if it is fresh (received within two push intervals) and was
+        received at least one push interval after the robot accepted the last
+        task; otherwise the robot is queried.
+        
+        Args:
+            force_poll: If True, always query the robot (default: False)
+            
         Returns:
             Task status code:
             - 0: NONE (no task)
@@ -759,18 +1106,31 @@ class SmartSeerController:
             
         Examples:
             # Start a non-blocking task
-            result = controller.execute_navigation(task_list, "My Task", wait=False)
+            result = controller.execute_navigation(task_list, wait=False)
             
-            # Check status periodically
-            while True:
-                status = controller.task_status()
-                if status in [4, 5, 6]:  # COMPLETED, FAILED, or CANCELED
-                    break
-                time.sleep(1)
+            # Do other work, checking in occasionally
+            if controller.task_status() in [4, 5, 6]:  # COMPLETED, FAILED, or CANCELED
+                print("Task finished")
+            
+            # Or block until the task finishes (wakes on push updates, no 1 s polling)
+            result = controller.wait_task_complete(timeout=120.0)
         """
         if not self.is_connected or self.robot is None:
             return -1
         
+        if not force_poll and self.robot.push.listening:
+            last_push_time = self._last_push_time
+            push_interval = self._push_interval / 1000.0
+            submit_time = self._task_submit_time
+            # A push sampled before the robot took the new task may still show the
+            # previous task's final status, so trust only pushes a full interval later
+            if (last_push_time is not None
+                    and time.monotonic() - last_push_time < 2 * push_interval
+                    and (submit_time is None or last_push_time >= submit_time + push_interval)):
+                task_status = self._push_data.get('task_status')
+                if task_status is not None:
+                    return task_status
+        
         # Query task status
         result = self.robot.status.query_status('task')
         
@@ -779,7 +1139,434 @@ class SmartSeerController:
         
         return result.get('task_status', -1)
 
-    def goto(self, target_id: str, wait: bool = True, timeout: float = 60.0) -> Dict[str, Any]:
+    def wait_task_complete(self, timeout: float = 600.0, query_interval_min: float = 0.05,
+                           query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                           on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Block until the current task leaves the RUNNING state.
+        
+        Use this after a non-blocking navigation call instead of a task_status()
+        polling loop. The wait is woken by push data as soon as the task status
+        changes and falls back to adaptive polling when push is unavailable.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (default: 600.0)
+            query_interval_min: Initial status polling interval in seconds (default: 0.05)
+            query_interval_max: Maximum status polling interval in seconds (default: None, meaning 1.0
+                                or up to the push timeout while push reports task_status)
+            backoff: Polling interval growth factor while the task status is unchanged (default: 2.0)
+            on_progress: Optional callback called with {'arrived': waypoint, 'elapsed': seconds}
+                         each time the robot passes a waypoint (default: None)
+            
+        Returns:
+            Dictionary with success, final_status, status_text, elapsed_time,
+            query_count, finished_path, unfinished_path and current_station
+            (plus error on failure)
+            
+        Examples:
+            controller.goto("LM2", wait=False)
+            result = controller.wait_task_complete(timeout=60.0)
+            if result["success"]:
+                print(f"Arrived in {result['elapsed_time']:.1f}s")
+        """
+        if not self.is_connected or self.robot is None:
+            return {
+                'success': False,
+                'final_status': -1,
+                'status_text': 'ERROR',
+                'elapsed_time': 0.0,
+                'query_count': 0,
+                'finished_path': [],
+                'unfinished_path': [],
+                'error': 'Robot not connected'
+            }
+        return self._wait_task_complete(timeout, query_interval_min, query_interval_max, backoff,
+                                        on_progress)
+
+    def _cached_query(self, key: str, ttl: float = 2.0) -> Optional[Dict[str, Any]]:
+        """
+        Query a status type, reusing a successful response younger than ttl seconds.
+        
+        Args:
+            key: Status query type (e.g., 'battery')
+            ttl: Maximum age in seconds of a cached response (default: 2.0)
+            
+        Returns:
+            Response dictionary, or None if the query failed (failures are not cached)
+        """
+        entry = self._status_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        result = self.robot.status.query_status(key)
+        if result and result.get('ret_code') == 0:
+            self._status_cache[key] = (now, result)
+        return result
+
+    def _query_status_multi(self, keys, timeout: float = 5.0) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Query several status types in one network round-trip.
+        
+        Thin wrapper over SeerStatusController.query_status_batch(): the status
+        requests are pipelined on the status connection (all frames are sent at
+        once and the replies are read back in order) and counted in its stats.
+        
+        Args:
+            keys: Status query types (e.g., ('task', 'loc'))
+            timeout: Timeout per reply in seconds (default: 5.0)
+            
+        Returns:
+            Dictionary mapping each query type to its response
+            (None if that query failed)
+            
+        Examples:
+            status = controller._query_status_multi(('battery', 'loc'))
+            battery = status['battery']
+        """
+        return self.robot.status.query_status_batch(keys, timeout=timeout)
+
+    @staticmethod
+    def _timeout_wait_result(elapsed: float, query_count: int, timeout: float) -> Dict[str, Any]:
+        """Build the wait result returned when waiting for a task times out."""
+        return {
+            'success': False,
+            'final_status': -1,
+            'status_text': 'TIMEOUT',
+            'elapsed_time': elapsed,
+            'query_count': query_count,
+            'finished_path': [],
+            'unfinished_path': [],
+            'error': f'Timeout after {timeout}s'
+        }
+
+    def _check_task_replies(self, replies: Dict[str, Optional[Dict[str, Any]]], start_time: float,
+                            query_count: int):
+        """
+        Evaluate one ('task', 'loc') poll of the task wait loops.
+        
+        Returns:
+            Tuple of (task_status, wait_result). task_status is None if the
+            query failed; wait_result is None while the task is still RUNNING.
+        """
+        task_result = replies['task']
+        if not task_result or task_result.get('ret_code') != 0:
+            return None, None
+        
+        task_status = task_result.get('task_status', -1)
+        
+        # Anything but RUNNING is a terminal state for the caller
+        if task_status == 2:
+            return task_status, None
+        
+        loc_result = replies['loc']
+        if loc_result and loc_result.get('ret_code') == 0:
+            self._loc_cache = {'station': loc_result.get('current_station', ''), 'ts': time.monotonic()}
+        return task_status, {
+            'success': task_status == 4,  # Only COMPLETED is success
+            'final_status': task_status,
+            'status_text': _TASK_STATUS_MAP.get(task_status, "UNKNOWN"),
+            'elapsed_time': time.monotonic() - start_time,
+            'query_count': query_count,
+            'finished_path': task_result.get('finished_path', []),
+            'unfinished_path': task_result.get('unfinished_path', []),
+            'current_station': loc_result.get('current_station') if loc_result else None
+        }
+
+    @staticmethod
+    def _report_progress(replies: Dict[str, Optional[Dict[str, Any]]], reported: int, start_time: float,
+                         on_progress: Callable[[Dict[str, Any]], None]) -> int:
+        """
+        Call on_progress once for each waypoint newly added to finished_path.
+        
+        Returns:
+            Number of finished_path waypoints reported so far
+        """
+        task_result = replies['task']
+        if not task_result or task_result.get('ret_code') != 0:
+            return reported
+        
+        finished_path = task_result.get('finished_path') or ()
+        if len(finished_path) > reported:
+            elapsed = time.monotonic() - start_time
+            for waypoint in finished_path[reported:]:
+                on_progress({'arrived': waypoint, 'elapsed': elapsed})
+            return len(finished_path)
+        return reported
+
+    def _wait_task_complete(self, timeout: float = 600.0, query_interval_min: float = 0.05,
+                            query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                            on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Wait for the current task to complete using adaptive polling.
+        
+        Polls the task status starting at query_interval_min and multiplies the
+        interval by backoff (up to query_interval_max) while the status is
+        unchanged. The interval drops back to query_interval_min whenever the
+        task status changes, so completions shortly after a transition are
+        picked up quickly while long tasks generate few queries.
+        
+        Between polls the loop waits on the push task event rather than
+        sleeping, so a task_status change in the push stream triggers the
+        confirming query immediately. Without push data the event never fires
+        and the loop behaves as plain adaptive polling. The first query is
+        issued right after submission, which catches tasks that finish at once.
+        
+        If query_interval_max is left as None, it is 1.0 - except that while
+        the push listener is running with task_status in push_fields (and no
+        on_progress callback needs finished_path updates), the interval keeps
+        backing off up to the push timeout: completion is signalled by push,
+        and the queries only confirm it or act as a safety net. An explicit
+        query_interval_max is always respected.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (default: 600.0)
+            query_interval_min: Initial/fastest polling interval in seconds (default: 0.05)
+            query_interval_max: Slowest polling interval in seconds (default: None, see above)
+            backoff: Interval growth factor while the status is unchanged (default: 2.0)
+            on_progress: Optional callback called with {'arrived': waypoint, 'elapsed': seconds}
+                         for each waypoint added to finished_path (default: None)
+            
+        Returns:
+            Dictionary in the same format as SeerController.wait_task_complete(),
+            plus current_station (station at completion, None if unknown)
+        """
+        query_multi = self._query_status_multi
+        check_replies = self._check_task_replies
+        task_event = self._task_event
+        schedule = self._task_poll_schedule(query_interval_min, query_interval_max, backoff, on_progress)
+        poll_keys = ('task', 'loc')
+        query_count = 0
+        reported = 0
+        start_time = time.monotonic()
+        
+        while True:
+            elapsed = time.monotonic() - start_time
+            
+            # Check timeout
+            if elapsed > timeout:
+                return self._timeout_wait_result(elapsed, query_count, timeout)
+            
+            # Task and location come back in the same round-trip; a push
+            # arriving after this point wakes the next iteration
+            task_event.clear()
+            query_count += 1
+            replies = query_multi(poll_keys, timeout=2.0)
+            if on_progress is not None:
+                reported = self._report_progress(replies, reported, start_time, on_progress)
+            task_status, wait_result = check_replies(replies, start_time, query_count)
+            if wait_result is not None:
+                return wait_result
+            
+            schedule.observe(task_status)
+            remaining = timeout - (time.monotonic() - start_time)
+            schedule.after_wait(task_event.wait(schedule.wait_time(remaining)))
+
+    async def _await_task(self, timeout: float = 600.0, query_interval_min: float = 0.05,
+                          query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                          on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Coroutine version of _wait_task_complete().
+        
+        Runs each blocking status query, and each wait on the push task
+        event, in the event loop's default executor, so the event loop stays
+        free while the robot is moving. The interval schedule is the same as
+        in _wait_task_complete() and waits never run past the timeout.
+        
+        Returns:
+            Dictionary in the same format as _wait_task_complete()
+        """
+        loop = asyncio.get_event_loop()
+        query_multi = self._query_status_multi
+        check_replies = self._check_task_replies
+        task_event = self._task_event
+        schedule = self._task_poll_schedule(query_interval_min, query_interval_max, backoff, on_progress)
+        poll_keys = ('task', 'loc')
+        query_count = 0
+        reported = 0
+        start_time = time.monotonic()
+        
+        while True:
+            elapsed = time.monotonic() - start_time
+            
+            # Check timeout
+            if elapsed > timeout:
+                return self._timeout_wait_result(elapsed, query_count, timeout)
+            
+            task_event.clear()
+            query_count += 1
+            replies = await loop.run_in_executor(None, query_multi, poll_keys, 2.0)
+            if on_progress is not None:
+                reported = self._report_progress(replies, reported, start_time, on_progress)
+            task_status, wait_result = check_replies(replies, start_time, query_count)
+            if wait_result is not None:
+                return wait_result
+            
+            schedule.observe(task_status)
+            remaining = timeout - (time.monotonic() - start_time)
+            woken = await loop.run_in_executor(None, task_event.wait, schedule.wait_time(remaining))
+            schedule.after_wait(woken)
+
+    def _task_poll_schedule(self, query_interval_min: float, query_interval_max: Optional[float],
+                            backoff: float, on_progress) -> _TaskPollSchedule:
+        """
+        Build the polling schedule for one task wait (see _wait_task_complete).
+        
+        An unset query_interval_max means 1.0, extended to the push timeout
+        while push reports task_status and no on_progress callback needs
+        finished_path updates. An explicit query_interval_max is never exceeded.
+        """
+        push_interval_max = query_interval_max
+        if query_interval_max is None:
+            query_interval_max = push_interval_max = 1.0
+            if on_progress is None and self.push_interval > 0 and 'task_status' in self.push_fields:
+                push_interval_max = max(query_interval_max, self._push_timeout)
+        return _TaskPollSchedule(query_interval_min, query_interval_max, push_interval_max, backoff,
+                                 self.robot.push)
+
+    @staticmethod
+    def _report_task(result: Dict[str, Any], description: str, wait_result: Dict[str, Any],
+                     verbose: bool) -> Dict[str, Any]:
+        """Fold a wait result into a navigation result, printing it if verbose."""
+        result["success"] = wait_result['success']
+        result["result"] = wait_result
+        
+        if verbose:
+            print(f"\n📊 Result: {wait_result['status_text']} in {wait_result['elapsed_time']:.1f}s")
+            
+            if wait_result['finished_path']:
+                print(f"   Path: {' → '.join(wait_result['finished_path'])}")
+            
+            if wait_result['success']:
+                print(f"✅ {description} completed successfully!\n")
+            else:
+                print(f"❌ {description} failed: {wait_result['status_text']}\n")
+        return result
+
+    def _dispatch_task(self, submit_fn, *, wait: bool, timeout: float, description: str,
+                       verbose: bool = True, query_interval_min: float = 0.05,
+                       query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                       on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run the submit / optional wait / report sequence shared by the navigation methods.
+        
+        Args:
+            submit_fn: Callable that sends the task and returns the method's result
+                       dictionary; its task_id is None if there is nothing to wait for
+            wait: Whether to block until the task completes
+            timeout: Maximum time to wait in seconds
+            description: Task description used in the result messages
+            verbose: If False, nothing is printed
+            query_interval_min, query_interval_max, backoff: Polling parameters
+            on_progress: Optional waypoint callback (see _wait_task_complete)
+            
+        Returns:
+            The submit result, updated with the outcome if wait=True
+        """
+        say = _say if verbose else _silent
+        result = submit_fn()
+        if result["task_id"] is None:
+            return result
+        
+        # If non-blocking mode, return immediately
+        if not wait:
+            say("🔓 Non-blocking mode: returning immediately (task running in background)\n")
+            return result
+        
+        # Blocking mode: wait for completion
+        say("⏳ Waiting for completion (timeout: %ss)...", timeout)
+        wait_result = self._wait_task_complete(timeout, query_interval_min, query_interval_max, backoff,
+                                               on_progress)
+        return self._report_task(result, description, wait_result, verbose)
+
+    async def _async_dispatch_task(self, submit_fn, *, wait: bool, timeout: float, description: str,
+                                   verbose: bool = True, query_interval_min: float = 0.05,
+                                   query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                                   on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Coroutine version of _dispatch_task(); submit_fn runs in the default executor."""
+        say = _say if verbose else _silent
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(None, submit_fn)
+        if result["task_id"] is None:
+            return result
+        
+        if not wait:
+            say("🔓 Non-blocking mode: returning immediately (task running in background)\n")
+            return result
+        
+        say("⏳ Waiting for completion (timeout: %ss)...", timeout)
+        wait_result = await self._await_task(timeout, query_interval_min, query_interval_max, backoff,
+                                             on_progress)
+        return self._report_task(result, description, wait_result, verbose)
+
+    def _start_goto(self, target_id: str, wait: bool, loc_cache_ttl: float = 0.5,
+                    verbose: bool = True) -> Dict[str, Any]:
+        """
+        Submit phase of goto(): check location and send gotarget.
+        
+        Returns:
+            goto() result dictionary. task_id is None if nothing needs to be
+            waited for (not connected, already at target, or submit failed).
+        """
+        say = _say if verbose else _silent
+        if not self.is_connected or self.robot is None:
+            say("❌ Robot not connected!")
+            return {"success": False, "task_id": None, "blocking": wait, "already_at_target": False, "result": None}
+        
+        # Record navigation call time
+        self.last_navigation_time = time.monotonic()
+        
+        # Use the cached location if it is fresh enough, otherwise query it.
+        # While push is running the cache is refreshed every push interval.
+        if loc_cache_ttl > 0 and self.robot.push.listening:
+            loc_cache_ttl = max(loc_cache_ttl, self._push_interval / 1000.0)
+        loc_cache = self._loc_cache
+        if time.monotonic() - loc_cache['ts'] < loc_cache_ttl:
+            current_station = loc_cache['station']
+        else:
+            loc_result = self.robot.status.query_status("loc")
+            
+            if not loc_result or loc_result.get('ret_code') != 0:
+                say("⚠️  Warning: Could not query current location, proceeding with navigation...")
+                current_station = None
+            else:
+                current_station = loc_result.get('current_station', '')
+                self._loc_cache = {'station': current_station, 'ts': time.monotonic()}
+        if current_station is not None:
+            say("📍 Current location: %s", current_station)
+        
+        # Check if already at target
+        if current_station and current_station == target_id:
+            say("✅ Already at %s, skipping navigation\n", target_id)
+            return {"success": True, "task_id": None, "blocking": wait, "already_at_target": True, "result": None}
+        
+        say("🎯 Navigating to: %s", target_id)
+        
+        # Use gotarget with only the target ID
+        result = self.robot.task.gotarget(id=target_id)
+        
+        if not result or result.get('ret_code') != 0:
+            say("❌ Failed to start navigation")
+            if result:
+                say("   Error code: %s", result.get('ret_code'))
+                say("   Message: %s", result.get('msg', 'No error message'))
+            return {"success": False, "task_id": None, "blocking": wait, "already_at_target": False, "result": result}
+        
+        # Pushes sampled before the robot accepted the task describe the previous one
+        self._task_submit_time = time.monotonic()
+        
+        # The robot is about to move; drop the cached station and charging state
+        self._loc_cache = {'station': None, 'ts': 0.0}
+        self._status_cache.pop('battery', None)
+        
+        task_id = result.get('task_id', 'N/A')
+        say("✅ Navigation started (ID: %s)", task_id)
+        return {"success": True, "task_id": task_id, "blocking": wait, "already_at_target": False, "result": result}
+
+    def goto(self, target_id: str, wait: bool = True, timeout: float = 60.0,
+             query_interval_min: float = 0.05, query_interval_max: Optional[float] = None,
+             backoff: float = 2.0, loc_cache_ttl: float = 0.5, verbose: bool = True,
+             on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Simple navigation to a target point - Navigate robot to target by ID.
         
@@ -791,6 +1578,16 @@ class SmartSeerController:
             target_id: Target station/point name (e.g., "LM2", "AP1", "Station5")
             wait: If True, waits for navigation completion (blocking). If False, returns immediately after starting (non-blocking).
             timeout: Maximum time to wait for navigation completion in seconds (default: 60.0, only used if wait=True)
+            query_interval_min: Initial status polling interval in seconds (default: 0.05, only used if wait=True)
+            query_interval_max: Maximum status polling interval in seconds (default: None, meaning 1.0
+                                or up to the push timeout while push reports task_status; only used if wait=True)
+            backoff: Polling interval growth factor while the task status is unchanged (default: 2.0)
+            loc_cache_ttl: Maximum age in seconds of a cached location (from push data or an
+                           earlier query) used instead of querying it; raised to the push interval
+                           while push is running (default: 0.5, 0 to always query)
+            verbose: If False, prints nothing (for headless callers) (default: True)
+            on_progress: Optional callback called with {'arrived': waypoint, 'elapsed': seconds}
+                         each time the robot passes a waypoint (default: None, only used if wait=True)
             
         Returns:
             Dictionary with:
@@ -798,6 +1595,7 @@ class SmartSeerController:
             - task_id (str): Task ID assigned by robot (None if already at target or failed)
             - blocking (bool): Whether method waited for completion
             - already_at_target (bool): Whether robot was already at target location
+            - result (dict): Full wait result if waited, otherwise the robot's response (None if not sent)
             
         Examples:
             # Blocking navigation (default)
@@ -813,68 +1611,80 @@ class SmartSeerController:
             # Custom timeout
             result = controller.goto("LM2", timeout=120.0)
         """
-        if not self.is_connected or self.robot is None:
-            print("❌ Robot not connected!")
-            return {"success": False, "task_id": None, "blocking": wait, "already_at_target": False}
+        return self._dispatch_task(
+            lambda: self._start_goto(target_id, wait, loc_cache_ttl, verbose),
+            wait=wait, timeout=timeout, description=f"Navigation to {target_id}", verbose=verbose,
+            query_interval_min=query_interval_min, query_interval_max=query_interval_max, backoff=backoff,
+            on_progress=on_progress)
+
+    async def async_goto(self, target_id: str, wait: bool = True, timeout: float = 60.0,
+                         query_interval_min: float = 0.05, query_interval_max: Optional[float] = None,
+                         backoff: float = 2.0, loc_cache_ttl: float = 0.5, verbose: bool = True,
+                         on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Coroutine version of goto().
         
-        # Record navigation call time
-        self.last_navigation_time = time.time()
+        Takes the same arguments and returns the same dictionary as goto(),
+        but waits for completion without blocking the event loop, so one
+        thread can supervise several robots at once. Each controller still
+        drives a single robot, so run one navigation per controller at a time.
         
-        # Query current location first
-        loc_result = self.robot.status.query_status("loc")
+        Examples:
+            results = await asyncio.gather(
+                robot_a.async_goto("LM2"),
+                robot_b.async_goto("LM5"),
+            )
+        """
+        return await self._async_dispatch_task(
+            lambda: self._start_goto(target_id, wait, loc_cache_ttl, verbose),
+            wait=wait, timeout=timeout, description=f"Navigation to {target_id}", verbose=verbose,
+            query_interval_min=query_interval_min, query_interval_max=query_interval_max, backoff=backoff,
+            on_progress=on_progress)
+
+    def _start_navigation(self, move_task_list: List[Dict[str, Any]], description: str,
+                          wait: bool, verbose: bool = True) -> Dict[str, Any]:
+        """
+        Submit phase of execute_navigation(): send gotargetlist.
         
-        if not loc_result or loc_result.get('ret_code') != 0:
-            print("⚠️  Warning: Could not query current location, proceeding with navigation...")
-            current_station = None
-        else:
-            current_station = loc_result.get('current_station', '')
-            print(f"📍 Current location: {current_station}")
+        Returns:
+            execute_navigation() result dictionary. task_id is None if the
+            robot is not connected or the task could not be started.
+        """
+        say = _say if verbose else _silent
+        if not self.is_connected or self.robot is None:
+            say("❌ Robot not connected!")
+            return {"success": False, "task_id": None, "blocking": wait, "result": None}
         
-        # Check if already at target
-        if current_station and current_station == target_id:
-            print(f"✅ Already at {target_id}, skipping navigation\n")
-            return {"success": True, "task_id": None, "blocking": wait, "already_at_target": True}
+        # Record navigation call time
+        self.last_navigation_time = time.monotonic()
         
-        print(f"🎯 Navigating to: {target_id}")
+        say("\n🚀 %s", description)
         
-        # Use gotarget with only the target ID
-        result = self.robot.task.gotarget(id=target_id)
+        # Send gotargetlist command
+        result = self.robot.task.gotargetlist(move_task_list)
         
         if not result or result.get('ret_code') != 0:
-            print("❌ Failed to start navigation")
+            say("❌ Failed to start task")
             if result:
-                print(f"   Error code: {result.get('ret_code')}")
-                print(f"   Message: {result.get('msg', 'No error message')}")
-            return {"success": False, "task_id": None, "blocking": wait, "already_at_target": False}
-        
-        task_id = result.get('task_id', 'N/A')
-        print(f"✅ Navigation started (ID: {task_id})")
-        
-        # If non-blocking mode, return immediately
-        if not wait:
-            print("🔓 Non-blocking mode: returning immediately (navigation running in background)\n")
-            return {"success": True, "task_id": task_id, "blocking": False, "already_at_target": False}
-        
-        # Blocking mode: wait for completion
-        print(f"⏳ Waiting for completion (timeout: {timeout}s)...")
-        
-        # Wait for task completion
-        wait_result = self.robot.wait_task_complete(query_interval=1.0, timeout=timeout)
+                say("   Error code: %s", result.get('ret_code'))
+                say("   Message: %s", result.get('msg', 'No error message'))
+            return {"success": False, "task_id": None, "blocking": wait, "result": result}
         
-        # Display result
-        print(f"\n📊 Result: {wait_result['status_text']} in {wait_result['elapsed_time']:.1f}s")
+        # Pushes sampled before the robot accepted the task describe the previous one
+        self._task_submit_time = time.monotonic()
         
-        if wait_result['finished_path']:
-            print(f"   Path: {' → '.join(wait_result['finished_path'])}")
+        # The robot is about to move; drop the cached station and charging state
+        self._loc_cache = {'station': None, 'ts': 0.0}
+        self._status_cache.pop('battery', None)
         
-        if wait_result['success']:
-            print(f"✅ Arrived at {target_id}!\n")
-            return {"success": True, "task_id": task_id, "blocking": True, "already_at_target": False}
-        else:
-            print(f"❌ Navigation to {target_id} failed: {wait_result['status_text']}\n")
-            return {"success": False, "task_id": task_id, "blocking": True, "already_at_target": False}
+        task_id = result.get('task_id', 'N/A')
+        say("✅ Task started (ID: %s)", task_id)
+        return {"success": True, "task_id": task_id, "blocking": wait, "result": result}
 
-    def execute_navigation(self, move_task_list: List[Dict[str, Any]], wait: bool = True, timeout: float = 600.0) -> Dict[str, Any]:
+    def execute_navigation(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan], wait: bool = True, timeout: float = 600.0,
+                           query_interval_min: float = 0.05, query_interval_max: Optional[float] = None,
+                           backoff: float = 2.0, verbose: bool = True,
+                           on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Execute a navigation task with a given move task list.
         
@@ -885,9 +1695,16 @@ class SmartSeerController:
         4. Report results
         
         Args:
-            move_task_list: List of waypoints/tasks to execute
+            move_task_list: List of waypoints/tasks to execute, or a MoveTaskPlan from plan()
             wait: If True, waits for task completion (blocking). If False, returns immediately after starting task (non-blocking).
             timeout: Maximum time to wait for task completion in seconds (default: 600.0, only used if wait=True)
+            query_interval_min: Initial status polling interval in seconds (default: 0.05, only used if wait=True)
+            query_interval_max: Maximum status polling interval in seconds (default: None, meaning 1.0
+                                or up to the push timeout while push reports task_status; only used if wait=True)
+            backoff: Polling interval growth factor while the task status is unchanged (default: 2.0)
+            verbose: If False, prints nothing (for headless callers) (default: True)
+            on_progress: Optional callback called with {'arrived': waypoint, 'elapsed': seconds}
+                         each time the robot passes a waypoint (default: None, only used if wait=True)
             
         Returns:
             Dictionary with:
@@ -896,56 +1713,63 @@ class SmartSeerController:
             - blocking (bool): Whether method waited for completion
             - result (dict): Full result from wait_task_complete if wait=True, otherwise None
         """
-        if not self.is_connected or self.robot is None:
-            print("❌ Robot not connected!")
-            return {"success": False, "task_id": None, "blocking": wait, "result": None}
-        
-        # Record navigation call time
-        self.last_navigation_time = time.time()
-        
-        # Auto-generate description from task list
-        description = self.gen_move_task_list_description(move_task_list)
-        
-        print(f"\n🚀 {description}")
-        
-        # Send gotargetlist command
-        result = self.robot.task.gotargetlist(move_task_list)
-        
-        if not result or result.get('ret_code') != 0:
-            print("❌ Failed to start task")
-            if result:
-                print(f"   Error code: {result.get('ret_code')}")
-                print(f"   Message: {result.get('msg', 'No error message')}")
-            return {"success": False, "task_id": None, "blocking": wait, "result": result}
-        
-        task_id = result.get('task_id', 'N/A')
-        print(f"✅ Task started (ID: {task_id})")
-        
-        # If non-blocking mode, return immediately
-        if not wait:
-            print("🔓 Non-blocking mode: returning immediately (task running in background)\n")
-            return {"success": True, "task_id": task_id, "blocking": False, "result": result}
+        # Description is generated from the task list once per plan
+        plan = self.plan(move_task_list)
+        
+        return self._dispatch_task(
+            lambda: self._start_navigation(plan.tasks, plan.description, wait, verbose),
+            wait=wait, timeout=timeout, description=plan.description, verbose=verbose,
+            query_interval_min=query_interval_min, query_interval_max=query_interval_max, backoff=backoff,
+            on_progress=on_progress)
+
+    async def async_execute_navigation(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan], wait: bool = True,
+                                       timeout: float = 600.0, query_interval_min: float = 0.05,
+                                       query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                                       verbose: bool = True,
+                                       on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Coroutine version of execute_navigation().
         
-        # Blocking mode: wait for completion
-        print(f"⏳ Waiting for completion (timeout: {timeout}s)...")
+        Takes the same arguments and returns the same dictionary as
+        execute_navigation(), without blocking the event loop while waiting.
+        """
+        plan = self.plan(move_task_list)
         
-        # Wait for task completion
-        wait_result = self.robot.wait_task_complete(query_interval=1.0, timeout=timeout)
+        return await self._async_dispatch_task(
+            lambda: self._start_navigation(plan.tasks, plan.description, wait, verbose),
+            wait=wait, timeout=timeout, description=plan.description, verbose=verbose,
+            query_interval_min=query_interval_min, query_interval_max=query_interval_max, backoff=backoff,
+            on_progress=on_progress)
+
+    def _find_start_position(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan], wait: bool,
+                             verbose: bool = True):
+        """
+        Find the start position for goto_start().
         
-        # Display result
-        print(f"\n📊 Result: {wait_result['status_text']} in {wait_result['elapsed_time']:.1f}s")
+        Returns:
+            Tuple of (start_position, error_result). error_result is the
+            goto_start() result to return if no start position can be used.
+        """
+        say = _say if verbose else _silent
+        if not self.is_connected or self.robot is None:
+            say("❌ Robot not connected!")
+            return None, {"success": False, "task_id": None, "blocking": wait, "start_position": None}
         
-        if wait_result['finished_path']:
-            print(f"   Path: {' → '.join(wait_result['finished_path'])}")
+        plan = self.plan(move_task_list)
+        if not plan.tasks:
+            say("❌ Empty move task list!")
+            return None, {"success": False, "task_id": None, "blocking": wait, "start_position": None}
         
-        if wait_result['success']:
-            print(f"✅ {description} completed successfully!\n")
-            return {"success": True, "task_id": task_id, "blocking": True, "result": wait_result}
-        else:
-            print(f"❌ {description} failed: {wait_result['status_text']}\n")
-            return {"success": False, "task_id": task_id, "blocking": True, "result": wait_result}
+        start_position = plan.start_position
+        if not start_position:
+            say("⚠️ No valid starting position found in move task list (all are SELF_POSITION)")
+            return None, {"success": False, "task_id": None, "blocking": wait, "start_position": None}
         
-    def goto_start(self, move_task_list: List[Dict[str, Any]], wait: bool = True, timeout: float = 60.0) -> Dict[str, Any]:
+        say("📍 Starting position identified: %s", start_position)
+        return start_position, None
+
+    def goto_start(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan], wait: bool = True,
+                   timeout: float = 60.0, verbose: bool = True) -> Dict[str, Any]:
         """
         Navigate to the starting position of a move task list.
         
@@ -954,9 +1778,10 @@ class SmartSeerController:
         the robot at the correct starting location before executing a task sequence.
         
         Args:
-            move_task_list: List of waypoints/tasks (same format as execute_navigation)
+            move_task_list: List of waypoints/tasks (same format as execute_navigation), or a MoveTaskPlan
             wait: If True, waits for navigation completion (blocking). If False, returns immediately after starting (non-blocking).
             timeout: Maximum time to wait for navigation completion in seconds (default: 60.0, only used if wait=True)
+            verbose: If False, prints nothing (for headless callers) (default: True)
             
         Returns:
             Dictionary with:
@@ -980,44 +1805,141 @@ class SmartSeerController:
             # Custom timeout
             result = controller.goto_start(move_task_list, timeout=120.0)
         """
-        if not self.is_connected or self.robot is None:
-            print("❌ Robot not connected!")
-            return {"success": False, "task_id": None, "blocking": wait, "start_position": None}
+        start_position, error_result = self._find_start_position(move_task_list, wait, verbose)
+        if error_result is not None:
+            return error_result
         
-        if not move_task_list:
-            print("❌ Empty move task list!")
-            return {"success": False, "task_id": None, "blocking": wait, "start_position": None}
-        
-        # Find the first source_id that is not SELF_POSITION
-        start_position = None
-        for task in move_task_list:
-            source_id = task.get('source_id', '')
-            if source_id and source_id != 'SELF_POSITION':
-                start_position = source_id
-                break
+        result = self.goto(start_position, wait=wait, timeout=timeout, verbose=verbose)
+        result["start_position"] = start_position
+        return result
+
+    async def async_goto_start(self, move_task_list: Union[List[Dict[str, Any]], MoveTaskPlan], wait: bool = True,
+                               timeout: float = 60.0, verbose: bool = True) -> Dict[str, Any]:
+        """
+        Coroutine version of goto_start().
         
-        if not start_position:
-            print("⚠️ No valid starting position found in move task list (all are SELF_POSITION)")
-            return {"success": False, "task_id": None, "blocking": wait, "start_position": None}
+        Takes the same arguments and returns the same dictionary as goto_start().
+        """
+        start_position, error_result = self._find_start_position(move_task_list, wait, verbose)
+        if error_result is not None:
+            return error_result
         
-        print(f"📍 Starting position identified: {start_position}")
-        result = self.goto(start_position, wait=wait, timeout=timeout)
+        result = await self.async_goto(start_position, wait=wait, timeout=timeout, verbose=verbose)
         result["start_position"] = start_position
         return result
-    
-    def goto_charge(self, via_point: str = "LM2", charge_point: str = "CP0", wait: bool = True, timeout: float = 300.0) -> Dict[str, Any]:
+
+    def _check_charging(self, wait: bool, verbose: bool = True,
+                        bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Pre-flight phase of goto_charge(): check whether the robot is already charging.
+        
+        While the push listener is running and its latest data is fresh
+        (received within two push intervals) and carries the 'charging' field,
+        the battery status is read from it without querying the robot.
+        Otherwise it comes from _cached_query(), so repeated calls within two
+        seconds share one query. bypass_cache forces a fresh query.
+        
+        Returns:
+            goto_charge() result dictionary to return right away (not connected
+            or already charging), or None if navigation should start
+        """
+        say = _say if verbose else _silent
+        if not self.is_connected or self.robot is None:
+            say("❌ Robot not connected!")
+            return {"success": False, "task_id": None, "blocking": wait, "already_charging": False, "result": None}
+        
+        # Check battery status to see if already charging
+        say("🔋 Checking charging status...")
+        battery_result = None
+        if bypass_cache:
+            self._status_cache.pop('battery', None)
+        elif self.robot.push.listening:
+            push_data = self._push_data
+            last_push_time = self._last_push_time
+            if ('charging' in push_data and last_push_time is not None
+                    and time.monotonic() - last_push_time < 2 * self._push_interval / 1000.0):
+                battery_result = push_data
+        if battery_result is None:
+            battery_result = self._cached_query('battery', ttl=2.0)
+            if battery_result and battery_result.get('ret_code') != 0:
+                battery_result = None
+        
+        if not battery_result:
+            say("⚠️  Warning: Could not query battery status, proceeding with navigation...")
+            is_charging = False
+        else:
+            is_charging = battery_result.get('charging', False)
+            say("   Battery: %s%%, Charging: %s", battery_result.get('battery_level', 'N/A'), is_charging)
+        
+        current_station = self._loc_cache['station']
+        if current_station is not None:
+            say("📍 Current location: %s", current_station)
+        
+        # If already charging, no need to move
+        if is_charging:
+            say("✅ Already charging, no navigation needed\n")
+            return {"success": True, "task_id": None, "blocking": wait, "already_charging": True, "result": None}
+        
+        return None
+
+    def _charge_task_list(self, via_point: str, charge_point: str) -> List[Dict[str, Any]]:
+        """
+        Build the move task list for goto_charge(): via_point, then charge_point.
+        
+        Both hops go in one gotargetlist so the robot plans a single path and
+        does not stop at the via point. The last hop docks with recognition.
+        """
+        return [
+            {"source_id": _SELF_POSITION, "id": via_point, "task_id": self._task_id_gen()},
+            {
+                "source_id": via_point,
+                "id": charge_point,
+                "task_id": self._task_id_gen(),
+                "operation": "wait",
+                "recognize": True
+            },
+        ]
+
+    @staticmethod
+    def _charge_result(nav_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an execute_navigation() result into a goto_charge() result."""
+        return {
+            "success": nav_result["success"],
+            "task_id": nav_result["task_id"],
+            "blocking": nav_result["blocking"],
+            "already_charging": False,
+            "result": nav_result["result"]
+        }
+
+    def goto_charge(self, via_point: str = "LM2", charge_point: str = "CP0", wait: bool = True, timeout: float = 300.0,
+                    query_interval_min: float = 0.05, query_interval_max: Optional[float] = None,
+                    backoff: float = 2.0, verbose: bool = True, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Navigate robot to charging point.
         First checks if already charging. If not charging, goes via intermediate point to charge point.
+        Both hops are sent as one move task list, so the robot drives through the
+        intermediate point without stopping.
         
         Args:
             via_point: Intermediate waypoint before charging (default: "LM2")
             charge_point: Charging station ID (default: "CP0")
             wait: If True, waits for navigation completion (blocking). If False, returns immediately after starting (non-blocking).
-            timeout: Maximum time to wait for each navigation segment in seconds (default: 300.0, only used if wait=True)
+            timeout: Maximum time to wait for the whole route in seconds (default: 300.0, only used if wait=True)
+            query_interval_min: Initial status polling interval in seconds (default: 0.05, only used if wait=True)
+            query_interval_max: Maximum status polling interval in seconds (default: None, meaning 1.0
+                                or up to the push timeout while push reports task_status; only used if wait=True)
+            backoff: Polling interval growth factor while the task status is unchanged (default: 2.0)
+            verbose: If False, prints nothing (for headless callers) (default: True)
+            bypass_cache: If True, query the battery status even if a response
+                          less than 2 seconds old is cached (default: False)
         
         Returns:
-            Dictionary with success status and task information
+            Dictionary with:
+            - success (bool): True if already charging or navigation started/completed successfully
+            - task_id (str): Task ID assigned by robot (None if already charging or failed)
+            - blocking (bool): Whether method waited for completion
+            - already_charging (bool): Whether the robot was already charging
+            - result (dict): Full wait result if wait=True, otherwise the robot's response (None if not sent)
             
         Examples:
             # Use default charging route (via LM2 to CP0)
@@ -1032,69 +1954,41 @@ class SmartSeerController:
             # Custom timeout
             result = controller.goto_charge(timeout=600.0)
         """
-        if not self.is_connected or self.robot is None:
-            print("❌ Robot not connected!")
-            return {"success": False, "task_id": None, "blocking": wait}
-        
-        # Check battery status to see if already charging
-        print("🔋 Checking charging status...")
-        battery_result = self.robot.status.query_status("battery")
-        
-        if not battery_result or battery_result.get('ret_code') != 0:
-            print("⚠️  Warning: Could not query battery status, proceeding with navigation...")
-            is_charging = False
-        else:
-            is_charging = battery_result.get('charging', False)
-            battery_level = battery_result.get('battery_level', 'N/A')
-            print(f"   Battery: {battery_level}%, Charging: {is_charging}")
+        say = _say if verbose else _silent
+        result = self._check_charging(wait, verbose, bypass_cache)
+        if result is not None:
+            return result
+        
+        say("📍 Not charging, navigating: %s → %s", via_point, charge_point)
+        move_task_list = self._charge_task_list(via_point, charge_point)
+        nav_result = self.execute_navigation(move_task_list, wait=wait, timeout=timeout,
+                                             query_interval_min=query_interval_min,
+                                             query_interval_max=query_interval_max,
+                                             backoff=backoff, verbose=verbose)
+        return self._charge_result(nav_result)
+
+    async def async_goto_charge(self, via_point: str = "LM2", charge_point: str = "CP0", wait: bool = True,
+                                timeout: float = 300.0, query_interval_min: float = 0.05,
+                                query_interval_max: Optional[float] = None, backoff: float = 2.0,
+                                verbose: bool = True, bypass_cache: bool = False) -> Dict[str, Any]:
+        """
+        Coroutine version of goto_charge().
         
-        # If already charging, no need to move
-        if is_charging:
-            print("✅ Already charging, no navigation needed\n")
-            return {"success": True, "task_id": None, "blocking": wait, "already_charging": True}
-        
-        # Not charging, go via intermediate point to charge point
-        print(f"📍 Not charging, navigating: {via_point} → {charge_point}")
-        
-        # Temporarily disable waiting for the via point to simplify logic
-        # # First go to intermediate point
-        # result = self.goto(via_point, wait=wait, timeout=timeout)
-        # if not result["success"]:
-        #     print(f"❌ Failed to reach {via_point}")
-        #     return result
-        
-        # Then go to charge point using task controller directly with recognize and wait operation
-        print(f"🔌 Going to charge point {charge_point} (recognize=True, operation='wait')")
-        task_result = self.robot.task.gotarget(id=charge_point, operation="wait", recognize=True)
-        
-        if task_result and task_result.get('ret_code') == 0:
-            task_id = task_result.get('task_id')
-            print(f"✅ Navigation to charge point started (Task ID: {task_id})")
-            
-            # Wait for task completion if requested
-            if wait:
-                print(f"⏳ Waiting for navigation to complete (timeout: {timeout}s)...")
-                success = self.wait_for_task_completion(task_id=task_id, timeout=timeout)
-                return {
-                    "success": success,
-                    "task_id": task_id,
-                    "blocking": True
-                }
-            else:
-                return {
-                    "success": True,
-                    "task_id": task_id,
-                    "blocking": False
-                }
-        else:
-            error_msg = task_result.get('err_msg', 'Unknown error') if task_result else 'No response'
-            print(f"❌ Failed to start navigation to charge point: {error_msg}")
-            return {
-                "success": False,
-                "task_id": None,
-                "blocking": wait,
-                "error": error_msg
-            }
+        Takes the same arguments and returns the same dictionary as goto_charge().
+        """
+        say = _say if verbose else _silent
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(None, self._check_charging, wait, verbose, bypass_cache)
+        if result is not None:
+            return result
+        
+        say("📍 Not charging, navigating: %s → %s", via_point, charge_point)
+        move_task_list = self._charge_task_list(via_point, charge_point)
+        nav_result = await self.async_execute_navigation(move_task_list, wait=wait, timeout=timeout,
+                                                         query_interval_min=query_interval_min,
+                                                         query_interval_max=query_interval_max,
+                                                         backoff=backoff, verbose=verbose)
+        return self._charge_result(nav_result)
 
 
 # ============================================================================
@@ -1107,7 +2001,11 @@ def main():
     
     Provides a command-line interface for controlling the SEER robot
     with navigation functions similar to dc_demo_2025.py.
+    Set the SEER_DEBUG environment variable to print full tracebacks
+    for failed commands.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("="*60)
     print("🤖 Smart SEER Controller - Interactive Control")
     print("="*60)
@@ -1126,35 +2024,33 @@ def main():
     print("Type 'exit' or 'quit' to exit")
     print("-"*60)
     
-    # Import parse_command_line from util
-    try:
-        from seer_control.util import parse_command_line
-    except ImportError:
-        # Fallback simple parser if util not available
-        def parse_command_line(line):
-            """Simple command line parser fallback."""
-            parts = line.split()
-            if not parts:
-                return None, {}
-            func_name = parts[0]
-            params = {}
-            for part in parts[1:]:
-                if '=' in part:
-                    key, val = part.split('=', 1)
-                    # Type conversion
-                    if val.lower() == 'true':
-                        val = True
-                    elif val.lower() == 'false':
-                        val = False
-                    elif val.isdigit():
-                        val = int(val)
-                    else:
-                        try:
-                            val = float(val)
-                        except ValueError:
-                            pass
-                    params[key] = val
-            return func_name, params
+    # Command dispatch table, built once: command name -> handler(**params)
+    exit_marker = object()
+    
+    def _exit(**_):
+        return exit_marker
+    
+    def _help(**_):
+        print("💡 Type any method name with parameters: method_name param1=value1 ...")
+        print("   Available methods: goto, goto_charge, goto_start, execute_navigation, task_status")
+        print("   Example: goto target_id=LM2")
+    
+    def _task_status(**_):
+        # Print the status code instead of returning it
+        print(f"📊 Task status: {controller.task_status()}")
+    
+    # Every public controller method, bound once after connect
+    dispatch = {}
+    for name in dir(controller):
+        if not name.startswith('_'):
+            attr = getattr(controller, name)
+            if callable(attr):
+                dispatch[name] = attr
+    dispatch.update({
+        'exit': _exit, 'quit': _exit, 'q': _exit,
+        'help': _help,
+        'task_status': _task_status,
+    })
     
     try:
         while True:
@@ -1174,47 +2070,36 @@ def main():
             if func_name is None:
                 continue
             
-            # Handle special commands
+            handler = dispatch.get(func_name)
+            if handler is None:
+                print(f"❌ Unknown command: {func_name}")
+                print("   Type 'help' for available commands")
+                continue
+            
             try:
-                if func_name in ['exit', 'quit', 'q']:
+                try:
+                    result = handler(**params)
+                except TypeError as e:
+                    print(f"❌ Invalid parameters for {func_name}: {e}")
+                    print(f"   Try: {func_name} with key=value parameters")
+                    continue
+                
+                if result is exit_marker:
                     print("\n👋 Exiting...")
                     break
                 
-                elif func_name == 'help':
-                    print("💡 Type any method name with parameters: method_name param1=value1 ...")
-                    print("   Available methods: goto, goto_charge, goto_start, execute_navigation, task_status")
-                    print("   Example: goto target_id=LM2")
-                
-                # Special handling for task_status - print the status code
-                elif func_name == 'task_status':
-                    status = controller.task_status()
-                    print(f"📊 Task status: {status}")
-                
-                # Try to call the method directly if it exists
-                elif hasattr(controller, func_name):
-                    method = getattr(controller, func_name)
-                    if callable(method):
-                        try:
-                            result = method(**params)
-                            # If result is a dict (for navigation functions), show task_id
-                            if isinstance(result, dict) and 'task_id' in result:
-                                print(f"📋 Task ID: {result.get('task_id', 'N/A')}")
-                        except TypeError as e:
-                            print(f"❌ Invalid parameters for {func_name}: {e}")
-                            print(f"   Try: {func_name} with key=value parameters")
-                    else:
-                        print(f"❌ '{func_name}' is not a callable method")
-                
-                else:
-                    print(f"❌ Unknown command: {func_name}")
-                    print("   Type 'help' for available commands")
+                # If result is a dict (for navigation functions), show task_id
+                if isinstance(result, dict) and 'task_id' in result:
+                    print(f"📋 Task ID: {result.get('task_id', 'N/A')}")
             
             except ValueError as e:
                 print(f"❌ Invalid parameter: {e}")
             except Exception as e:
-                print(f"❌ Error executing command: {e}")
-                import traceback
-                traceback.print_exc()
+                # Full traceback only when debugging (SEER_DEBUG=1)
+                if os.environ.get("SEER_DEBUG"):
+                    traceback.print_exc()
+                else:
+                    print(f"❌ Error executing command: {type(e).__name__}: {e}")
     
     except KeyboardInterrupt:
         print("\n\n🛑 Interrupted by user")
@@ -10,10 +10,13 @@ Usage:
     python test_connection_health.py
 """
 
+import logging
 import time
 from smart_seer_controller import SmartSeerController
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     ROBOT_IP = "192.168.12.163"
     
     print("="*60)
@@ -51,8 +54,8 @@ def main():
                     print("\n🔴 CONNECTION LOST DETECTED!")
                 last_status = is_healthy
             
-            # Wait before next check
-            time.sleep(2)  # Check every 2 seconds
+            # Wait before next check (shorter while push data lags)
+            time.sleep(ctrl.next_interval())
             
     except KeyboardInterrupt:
         print("\n\n3. Shutting down...")
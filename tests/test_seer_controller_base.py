@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for SeerControllerBase framing, pipelining and resynchronisation,
+run against a loopback fake robot.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seer_control.seer_controller_base import SeerControllerBase, HEADER_FORMAT, HEADER_SIZE
+from seer_control.seer_push_controller import SeerPushController
+
+
+def _frame(msg_type, payload, req_id=0):
+    """Pack one SEER frame."""
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    return struct.pack(HEADER_FORMAT, 0x5A, 0x01, req_id, len(body), msg_type, b'\x00' * 6) + body
+
+
+class FakeRobot:
+    """
+    Loopback server answering each request with msg_type + 10000.
+
+    The reply payload echoes the request type and payload. delays maps a
+    request type to seconds to wait before replying; before_reply maps a
+    request type to raw bytes sent ahead of its reply.
+    """
+
+    def __init__(self, delays=None, before_reply=None, on_accept=b''):
+        self.delays = delays or {}
+        self.before_reply = before_reply or {}
+        self.on_accept = on_accept
+        self.accepted = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(8)
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        buffer = b''
+        try:
+            if self.on_accept:
+                conn.sendall(self.on_accept)
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    return
+                buffer += data
+                while len(buffer) >= HEADER_SIZE:
+                    _, _, req_id, msg_len, msg_type, _ = struct.unpack(HEADER_FORMAT, buffer[:HEADER_SIZE])
+                    if len(buffer) < HEADER_SIZE + msg_len:
+                        break
+                    body = buffer[HEADER_SIZE:HEADER_SIZE + msg_len]
+                    buffer = buffer[HEADER_SIZE + msg_len:]
+                    time.sleep(self.delays.get(msg_type, 0))
+                    reply = {'ret_code': 0, 'type': msg_type}
+                    if body:
+                        reply['echo'] = json.loads(body.decode('utf-8'))
+                    conn.sendall(self.before_reply.get(msg_type, b'') + _frame(msg_type + 10000, reply, req_id))
+        except OSError:
+            return
+        finally:
+            conn.close()
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.fixture
+def make_robot():
+    robots = []
+
+    def factory(**kwargs):
+        robot = FakeRobot(**kwargs)
+        robots.append(robot)
+        return robot
+
+    yield factory
+    for robot in robots:
+        robot.close()
+
+
+def test_request_reply(make_robot):
+    robot = make_robot()
+    ctrl = SeerControllerBase('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    result = ctrl.send_command(1, 1004, {'id': 'LM2'}, 11004, timeout=2.0)
+
+    assert result == {'ret_code': 0, 'type': 1004, 'echo': {'id': 'LM2'}}
+    assert ctrl.stats['successful_commands'] == 1
+    ctrl.disconnect()
+
+
+def test_pipelined_batch(make_robot):
+    robot = make_robot()
+    ctrl = SeerControllerBase('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    results = ctrl.send_commands([
+        (1004, None, 11004),
+        (1007, {'simple': True}, 11007),
+        (1020, None, 11020),
+    ], timeout=2.0)
+
+    assert [r['type'] for r in results] == [1004, 1007, 1020]
+    assert results[1]['echo'] == {'simple': True}
+    assert robot.accepted == 1
+    ctrl.disconnect()
+
+
+def test_timeout_drops_socket_and_reconnects(make_robot):
+    robot = make_robot(delays={1: 0.6})
+    ctrl = SeerControllerBase('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    # The slow first reply times out with the second still unread
+    assert ctrl.send_commands([(1, None, 10001), (2, None, 10002)], timeout=0.2) == [None, None]
+    assert ctrl.socket is None
+    assert ctrl.connected
+
+    # The next command reconnects and gets its own reply, not a late one
+    result = ctrl.send_command(1, 3, None, 10003, timeout=2.0)
+    assert result['type'] == 3
+    assert robot.accepted == 2
+    ctrl.disconnect()
+
+
+def test_mismatched_reply_is_rejected(make_robot):
+    robot = make_robot()
+    ctrl = SeerControllerBase('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    assert ctrl.send_command(1, 5, None, 99999, timeout=2.0) is None
+    assert ctrl.socket is None
+    assert ctrl.send_command(1, 6, None, 10006, timeout=2.0)['type'] == 6
+    ctrl.disconnect()
+
+
+def test_push_frame_before_config_reply(make_robot):
+    push_frame = _frame(19301, {'x': 1.0})
+    robot = make_robot(on_accept=push_frame, before_reply={9300: push_frame})
+    ctrl = SeerPushController('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    result = ctrl.configure_push(interval=100)
+
+    assert result['type'] == 9300
+    assert ctrl.connected and ctrl.socket is not None
+    ctrl.disconnect()
+
+
+def test_push_controller_drop_marks_disconnected(make_robot):
+    robot = make_robot()
+    ctrl = SeerPushController('127.0.0.1', robot.port)
+    assert ctrl.connect(timeout=2.0)
+
+    # A reply of the wrong type desynchronises the push socket
+    assert ctrl.send_command(1, 9300, {}, 12345, timeout=2.0) is None
+
+    assert not ctrl.connected
+    assert ctrl.start_listening() is False
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for seer_control.util command log parsing.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seer_control.util import parse_command_line, parse_command_log
+
+
+def test_parse_command_log_file_path(tmp_path):
+    """Lines read from a file keep their newline; every command must still parse."""
+    log_file = tmp_path / "commands.log"
+    log_file.write_text(
+        "stop\n"
+        "gotarget id=LM2 spin=true\n"
+        "\n"
+        "turn angle=-1.5 vw=1\r\n"
+        "reloc x=0.0 y=2 angle=0.0",
+        encoding="utf-8",
+    )
+    
+    commands = [(name, dict(params)) for name, params in parse_command_log(str(log_file))]
+    
+    assert commands == [
+        ('stop', {}),
+        ('gotarget', {'id': 'LM2', 'spin': True}),
+        ('turn', {'angle': -1.5, 'vw': 1}),
+        ('reloc', {'x': 0.0, 'y': 2, 'angle': 0.0}),
+    ]
+
+
+def test_parse_command_log_bytes():
+    """Raw log content parses the same way as a file."""
+    commands = [(name, dict(params)) for name, params in
+                parse_command_log(b"stop\ngotarget id=LM2 spin=true\n")]
+    
+    assert commands == [('stop', {}), ('gotarget', {'id': 'LM2', 'spin': True})]
+
+
+def test_parse_command_log_end_anchor_at_text_end(tmp_path, monkeypatch):
+    """With RE2 semantics ('$' only at the end of the text) file lines still parse."""
+    import re
+    from seer_control import util
+    
+    monkeypatch.setattr(util, '_LOG_LINE_RE', re.compile(r'^\s*(\S+)(.*)\Z'))
+    log_file = tmp_path / "commands.log"
+    log_file.write_text("stop\ngotarget id=LM2\n", encoding="utf-8")
+    
+    assert [name for name, _ in parse_command_log(str(log_file))] == ['stop', 'gotarget']
+
+
+def test_parse_command_line_non_decimal_digits():
+    """Digit-like characters that int() rejects stay strings instead of raising."""
+    assert dict(parse_command_line("f x=-² y=+3 z=--5")[1]) == {'x': '-²', 'y': 3, 'z': '--5'}